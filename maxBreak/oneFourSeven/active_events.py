@@ -0,0 +1,47 @@
+# oneFourSeven/active_events.py
+"""
+Cached "active tournaments today" lookup for the live-monitoring commands.
+
+The set of events running on a given day changes at most when tournaments
+are re-synced, but the live monitors ask for it on every poll. The list is
+kept in Django's cache (shared across processes when a Redis/memcached
+backend is configured, per-process with the default locmem cache) and
+dropped whenever events are saved.
+"""
+
+from datetime import timedelta
+
+from django.core.cache import cache
+
+from .models import Event
+
+ACTIVE_EVENTS_TTL = 3600  # seconds
+
+
+def _cache_key(today):
+    return f'v1:active_events:{today.isoformat()}'
+
+
+def get_active_events(today):
+    """
+    Events running on ``today`` or starting tomorrow
+    (StartDate <= today + 1 and EndDate >= today), ordered by StartDate.
+    Only ID, Name, StartDate and EndDate are loaded.
+    """
+    key = _cache_key(today)
+    events = cache.get(key)
+    if events is None:
+        events = list(
+            Event.objects.filter(
+                StartDate__lte=today + timedelta(days=1),
+                EndDate__gte=today,
+            ).order_by('StartDate').only('ID', 'Name', 'StartDate', 'EndDate')
+        )
+        cache.set(key, events, ACTIVE_EVENTS_TTL)
+    return events
+
+
+def invalidate_active_events(today):
+    """Drop the cached lists that could include events just saved."""
+    # Keys are per day; only days still within the TTL can be cached
+    cache.delete_many([_cache_key(today + timedelta(days=offset)) for offset in (-1, 0, 1)])
@@ -6,6 +6,7 @@ Handles all HTTP requests, rate limiting, and error handling.
 
 import requests
 import logging
+import threading
 import time
 from typing import Dict, List, Optional, Any, Union
 from .constants import (
@@ -13,6 +14,7 @@ from .constants import (
     T_EVENT_MATCHES, T_ROUND_DETAILS, T_SEASON_EVENTS, T_PLAYER_INFO, T_PLAYERS,
     T_RANKING, T_HEAD_TO_HEAD, T_CURRENT_SEASON, T_EVENT_DETAILS
 )
+from .exceptions import NoDataYet, RateLimited, ServerError
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +30,22 @@ class SnookerAPIClient:
         self.headers = HEADERS.copy()
         self.timeout = DEFAULT_TIMEOUT
         self._last_request_time = 0.0
-        
+        self._rate_lock = threading.Lock()  # callers may share the client across threads
+        # One keep-alive session so back-to-back requests reuse the connection
+        # instead of a new TCP/TLS handshake each time
+        self.session = requests.Session()
+        # Per-thread, so workers sharing the client each see their own failure
+        self._local = threading.local()
+
+    @property
+    def last_error(self) -> Optional[Exception]:
+        """Classified cause of this thread's most recent failed request (None after a success)."""
+        return getattr(self._local, 'last_error', None)
+
+    @last_error.setter
+    def last_error(self, error: Optional[Exception]) -> None:
+        self._local.last_error = error
+
     def _make_request(self, endpoint_params: Dict[str, Union[str, int]]) -> Optional[Union[List, Dict]]:
         """
         Makes a request to the snooker.org API with the given parameters.
@@ -38,14 +55,12 @@ class SnookerAPIClient:
             
         Returns:
             JSON response as list or dict if successful, None if failed
+            (the cause is left on ``self.last_error`` for the calling thread)
         """
+        self.last_error = None
+
         # Enforce rate limit: max 2 requests/minute = 30s minimum gap
-        elapsed = time.time() - self._last_request_time
-        wait = MIN_REQUEST_INTERVAL - elapsed
-        if wait > 0:
-            logger.debug(f"Rate limit: sleeping {wait:.1f}s before next request")
-            time.sleep(wait)
-        self._last_request_time = time.time()
+        self.wait_for_request_slot()
 
         # Construct URL with parameters
         param_string = "&".join([f"{k}={v}" for k, v in endpoint_params.items()])
@@ -61,7 +76,7 @@ class SnookerAPIClient:
         })
 
         try:
-            response = requests.get(url, headers=request_headers, timeout=self.timeout)
+            response = self.session.get(url, headers=request_headers, timeout=self.timeout)
             response.raise_for_status()
             
             if not response.content:
@@ -72,12 +87,15 @@ class SnookerAPIClient:
             
         except requests.exceptions.HTTPError as e:
             logger.error(f"HTTP Error {e.response.status_code} from {url}: {e.response.text[:200]}...")
+            self.last_error = self._classify_http_error(e.response)
             return None
         except requests.exceptions.Timeout:
             logger.error(f"Timeout ({self.timeout}s) for {url}")
+            self.last_error = ServerError(f"Timeout ({self.timeout}s) for {url}")
             return None
         except requests.exceptions.ConnectionError as e:
             logger.error(f"Connection error for {url}: {e}")
+            self.last_error = ServerError(f"Connection error for {url}: {e}")
             return None
         except requests.exceptions.JSONDecodeError:
             logger.warning(f"Invalid JSON response from {url}")
@@ -86,6 +104,45 @@ class SnookerAPIClient:
             logger.error(f"Unexpected error for {url}: {e}", exc_info=True)
             return None
 
+    def wait_for_request_slot(self) -> None:
+        """
+        Block until this caller's rate-limit slot comes up. Commands that call
+        snooker.org endpoints this client has no fetcher for use this (and
+        ``self.session``) so they share the same throttle and connection.
+        """
+        wait = self._reserve_request_slot()
+        if wait > 0:
+            logger.debug(f"Rate limit: sleeping {wait:.1f}s before next request")
+            time.sleep(wait)
+
+    def _reserve_request_slot(self) -> float:
+        """
+        Claim the next free request slot and return how long to wait for it.
+        Slots are handed out under a lock, so concurrent callers queue up
+        MIN_REQUEST_INTERVAL apart instead of all firing at once.
+        """
+        with self._rate_lock:
+            now = time.time()
+            slot = max(now, self._last_request_time + MIN_REQUEST_INTERVAL)
+            self._last_request_time = slot
+        return slot - now
+
+    @staticmethod
+    def _classify_http_error(response) -> Optional[Exception]:
+        """Map an HTTP error response to NoDataYet / RateLimited / ServerError."""
+        status = response.status_code
+        if status == 404:
+            return NoDataYet(f"HTTP 404: {response.url}")
+        if status == 429:
+            try:
+                retry_after = int(response.headers.get('Retry-After', ''))
+            except ValueError:
+                retry_after = 2 * MIN_REQUEST_INTERVAL
+            return RateLimited(f"HTTP 429: {response.url}", retry_after=retry_after)
+        if status >= 500:
+            return ServerError(f"HTTP {status}: {response.url}")
+        return None
+
     def fetch_current_season(self) -> Optional[int]:
         """Fetch the current snooker season year."""
         logger.info("Fetching current season...")
@@ -178,6 +235,14 @@ class SnookerAPIClient:
                 pass
         return None
 
+    def fetch_player_profile(self, player_id: int) -> Optional[Dict]:
+        """Fetch one player's profile (t=4), as used to backfill unknown match players."""
+        data = self._make_request({'t': 4, 'p': player_id})
+        pdata = data[0] if isinstance(data, list) and data else data
+        if not isinstance(pdata, dict) or pdata.get('ID') != player_id:
+            return None
+        return pdata
+
     def fetch_head_to_head(self, player1_id: int, player2_id: int, season: int = -1, tour: str = None) -> Optional[Union[List, Dict]]:
         """Fetch head-to-head statistics between two players.
         tour=None  → all tours (default — used by H2H tab)
@@ -214,5 +279,6 @@ fetch_ranking_data = api_client.fetch_rankings
 fetch_event_matches_data = api_client.fetch_event_matches
 fetch_event_details_data = api_client.fetch_event_details
 fetch_player_by_id_data = api_client.fetch_player_by_id
+fetch_player_profile_data = api_client.fetch_player_profile
 fetch_h2h_data = api_client.fetch_head_to_head
 fetch_round_details_data = api_client.fetch_round_details
\ No newline at end of file
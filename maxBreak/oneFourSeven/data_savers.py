@@ -4,17 +4,37 @@ Database operations for saving and updating model instances.
 Handles all database interactions with proper error handling and logging.
 """
 
+import hashlib
+import json
 import logging
+from datetime import date
 from typing import Dict, List, Optional, Any, Tuple, Type, Set
+from django.core.cache import cache
 from django.db import IntegrityError, transaction
 from django.db.models import Model
 from django.core.exceptions import ObjectDoesNotExist
 
 from .models import Event, Player, Ranking, MatchesOfAnEvent, RoundDetails
+from .active_events import invalidate_active_events
 from .data_mappers import prepare_data_for_model
 
 logger = logging.getLogger(__name__)
 
+# How long an event's last saved match payload is remembered. Polls that
+# fetch an identical payload within this window skip the database entirely;
+# after it expires the next poll rewrites the rows, so edits made directly
+# in the database are reconciled with the API at least this often.
+MATCH_PAYLOAD_TTL = 3600  # seconds
+
+
+def _match_payload_key(event_id: int) -> str:
+    return f'v1:event_matches_hash:{event_id}'
+
+
+def _match_payload_hash(matches_data: List[Dict[str, Any]]) -> str:
+    payload = json.dumps(matches_data, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
 
 class DatabaseSaver:
     """Handles saving and updating model instances with proper error handling."""
@@ -175,6 +195,9 @@ class DatabaseSaver:
             else:
                 stats["failed"] += 1
         
+        if stats["created"] or stats["updated"]:
+            invalidate_active_events(date.today())
+        
         logger.info(f"Event save summary: {stats}")
         return stats
 
@@ -269,6 +292,13 @@ class DatabaseSaver:
             logger.info(f"No match data for event {event_id}")
             return {"created": 0, "updated": 0, "failed": 0, "skipped": 0}
         
+        # An unchanged payload (the common case between live polls) has
+        # nothing to write
+        payload_hash = _match_payload_hash(matches_data)
+        if cache.get(_match_payload_key(event_id)) == payload_hash:
+            logger.info(f"Matches for event {event_id} unchanged since last save - skipping")
+            return {"created": 0, "updated": 0, "failed": 0, "skipped": len(matches_data)}
+        
         logger.info(f"Saving {len(matches_data)} matches for event {event_id}...")
         stats = {"created": 0, "updated": 0, "failed": 0, "skipped": 0}
         
@@ -278,9 +308,20 @@ class DatabaseSaver:
             logger.error(f"Event {event_id} not found")
             return {"created": 0, "updated": 0, "failed": len(matches_data), "skipped": 0}
         
+        field_names = {f.name for f in MatchesOfAnEvent._meta.concrete_fields} - {'id', 'Event'}
+        to_update = {}
+        to_create = {}
+        update_fields = set()
+        
         # Use transaction for atomicity
         try:
             with transaction.atomic():
+                # Every match already stored for the event, by logical key
+                # (Round, Number), loaded in one query
+                existing = {
+                    (match.Round, match.Number): match
+                    for match in MatchesOfAnEvent.objects.filter(Event=event).order_by()
+                }
                 for match_data in matches_data:
                     if not isinstance(match_data, dict):
                         stats["skipped"] += 1
@@ -317,25 +358,45 @@ class DatabaseSaver:
                     # CRITICAL FIX: Validate score consistency to prevent display bugs
                     self._validate_match_score_consistency(defaults, match_data, api_match_id)
 
-                    # Use logical key for lookup
-                    lookup = {
-                        'Event': event,
-                        'Round': round_int,
-                        'Number': number_int
-                    }
-
                     # CRITICAL FIX: Check if we should skip this update to prevent data downgrade
                     # Don't overwrite real player data with TBD, or finished matches with upcoming
-                    existing_match = MatchesOfAnEvent.objects.filter(**lookup).first()
+                    key = (round_int, number_int)
+                    existing_match = existing.get(key)
                     if existing_match and self._should_skip_match_update(existing_match, defaults, api_match_id):
                         stats["skipped"] += 1
                         continue
 
-                    instance, created = self.update_or_create_item(MatchesOfAnEvent, lookup, defaults)
-                    if instance:
-                        stats["created" if created else "updated"] += 1
-                    else:
-                        stats["failed"] += 1
+                    valid_defaults = {k: v for k, v in defaults.items() if k in field_names}
+                    lookup = {'Event': event, 'Round': round_int, 'Number': number_int}
+                    if existing_match is None:
+                        # Also registered in existing, so a repeated (Round, Number)
+                        # later in the payload updates this pending row
+                        existing[key] = to_create[key] = MatchesOfAnEvent(**{**valid_defaults, **lookup})
+                        self._log_database_operation(MatchesOfAnEvent, lookup, valid_defaults, True, None, {})
+                        stats["created"] += 1
+                        continue
+
+                    old_values = {k: getattr(existing_match, k) for k in valid_defaults}
+                    for field_name, value in valid_defaults.items():
+                        setattr(existing_match, field_name, value)
+                    if key not in to_create:
+                        # Only columns that actually changed are written
+                        changed = {k for k, v in valid_defaults.items() if old_values[k] != v}
+                        if changed:
+                            to_update[key] = existing_match
+                            update_fields.update(changed)
+                    self._log_database_operation(MatchesOfAnEvent, lookup, valid_defaults, False, existing_match, old_values)
+                    stats["updated"] += 1
+
+                # One batched UPDATE for changed rows and one INSERT for new
+                # ones, instead of a SELECT plus update_or_create per match.
+                # A row inserted concurrently raises IntegrityError here, so the
+                # whole save rolls back and counts as failed (and is retried on
+                # the next poll) rather than being dropped silently
+                if to_update:
+                    MatchesOfAnEvent.objects.bulk_update(to_update.values(), sorted(update_fields), batch_size=500)
+                if to_create:
+                    MatchesOfAnEvent.objects.bulk_create(to_create.values(), batch_size=500)
         
         except Exception as e:
             logger.error(f"Transaction failed for event {event_id} matches: {e}", exc_info=True)
@@ -343,6 +404,9 @@ class DatabaseSaver:
             stats["created"] = 0
             stats["updated"] = 0
         
+        if not stats["failed"]:
+            cache.set(_match_payload_key(event_id), payload_hash, MATCH_PAYLOAD_TTL)
+        
         logger.info(f"Match save summary for event {event_id}: {stats}")
         return stats
     
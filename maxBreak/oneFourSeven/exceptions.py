@@ -0,0 +1,33 @@
+# oneFourSeven/exceptions.py
+"""
+Classified snooker.org API failures.
+
+The API client still returns None on failure (callers rely on that), but it
+records *why* on ``api_client.last_error`` so commands can tell "nothing
+published yet" apart from rate limiting or a real outage.
+
+These subclass CommandError so a command that lets one escape still exits
+cleanly from manage.py, while call_command() callers can catch them by type.
+"""
+
+from django.core.management.base import CommandError
+
+
+class SnookerAPIError(CommandError):
+    """Base class for classified snooker.org API failures."""
+
+
+class NoDataYet(SnookerAPIError):
+    """HTTP 404 or an empty payload - the data simply isn't published yet."""
+
+
+class RateLimited(SnookerAPIError):
+    """HTTP 429 - back off for ``retry_after`` seconds before the next call."""
+
+    def __init__(self, message='', retry_after=60):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ServerError(SnookerAPIError):
+    """HTTP 5xx, timeout or connection failure - the API itself is unhealthy."""
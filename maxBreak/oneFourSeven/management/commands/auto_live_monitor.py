@@ -29,20 +29,92 @@ DEPLOYMENT:
 Add to Procfile: live_monitor: cd maxBreak && python manage.py auto_live_monitor
 """
 
+import heapq
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
+from django.db import connection
+from django.db.models import Exists, Max, OuterRef
 from django.utils import timezone
-from oneFourSeven.models import Event, MatchesOfAnEvent
+from oneFourSeven.constants import MIN_REQUEST_INTERVAL, current_season_int
+from oneFourSeven.exceptions import NoDataYet, RateLimited, ServerError
+from oneFourSeven.models import (
+    Event, MatchesOfAnEvent, NotifDedup, Player, PlayerCareerStats,
+    ScheduledJobRun, UpcomingMatch,
+)
+from oneFourSeven.push_notifications import (
+    send_expo_push, get_tokens_for_match, get_tokens_for_match_db_id, get_tokens_for_player,
+)
+from oneFourSeven.management.commands.update_live_matches import run_live_matches
+from oneFourSeven.management.commands.update_matches import run_update_matches
 
 # Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _next_daily_run(now):
+    """Next 02:00 UTC after ``now`` — start of the 2-4am daily window."""
+    run = now.replace(hour=2, minute=0, second=0, microsecond=0)
+    return run if run > now else run + timedelta(days=1)
+
+
+def _next_monthly_run(now):
+    """Next 1st-of-month 02:00 UTC after ``now``."""
+    run = now.replace(day=1, hour=2, minute=0, second=0, microsecond=0)
+    if run <= now:
+        run = (run + timedelta(days=32)).replace(day=1)
+    return run
+
+
+def _next_even_hour(now):
+    """Next top of an even UTC hour after ``now``."""
+    run = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    return run if run.hour % 2 == 0 else run + timedelta(hours=1)
+
+
+def _next_hour(now):
+    return now + timedelta(hours=1)
+
+
+@lru_cache(maxsize=None)
+def _ranking_types_for_tour(tour):
+    """Ranking types to refresh after a tournament on ``tour`` ends."""
+    ranking_types = [
+        'MoneyRankings',
+        'WorldRankings',
+        'OneYearRanking',
+        'OneYearMoneyRankings',
+        'MoneySeedings',
+        'QTRankings',
+    ]
+    # Add women's rankings if applicable
+    if tour in ('womens', 'main'):
+        ranking_types.append('WomensRankings')
+    # Add amateur rankings if applicable
+    if tour in ('amateur', 'other'):
+        ranking_types.append('AmateurRankings')
+    return tuple(ranking_types)
+
+
 class Command(BaseCommand):
     help = 'Automatic live match monitor that runs continuously'
+    verbosity = 1  # overwritten from options in handle()
+    UPCOMING_UPDATE_WORKERS = 2  # see _run_upcoming_tournament_updates
+
+    # Idle-path jobs: (check method, next-run function, completion message).
+    # Each check still applies its own window/dedup guard; the schedule only
+    # decides when a check is worth calling at all, so quiet ticks no longer
+    # evaluate (and query for) every job.
+    IDLE_JOBS = (
+        ('_check_daily_updates', _next_daily_run, '[AUTOMATION] Daily updates completed'),
+        ('_check_monthly_updates', _next_monthly_run, '[AUTOMATION] Monthly updates completed'),
+        ('_check_upcoming_tournament_updates', _next_even_hour, '[AUTOMATION] Upcoming tournament updates completed'),
+        ('_check_tournament_end_updates', _next_hour, '[AUTOMATION] Tournament end updates completed'),
+    )
 
     def __init__(self):
         super().__init__()
@@ -52,13 +124,16 @@ class Command(BaseCommand):
         self.processed_tournament_ends = set()  # Track processed tournament end updates
         self.last_daily_run = None              # Track last date daily updates ran (date object)
         self.last_monthly_run = None            # Track last month monthly updates ran (YYYY-MM string)
+        self.last_upcoming_check = None         # Track last hour upcoming-tournament check queried (datetime)
         self.last_news_fetch = None             # Track last news RSS fetch time
+        self.upcoming_last_updated = None       # Newest UpcomingMatch refresh we know of (seeded from DB once)
         self.last_player_history_run = None     # Track last date player history updated during active tour
         self.last_stats_update_run = None       # Track last date nightly stats commands ran during active tour
         self.pretournament_processed = set()    # Track event IDs already pre-synced (new-players-only)
         self.currently_on_break = {}            # {db_pk: api_match_id} for matches at Status=2
                                                 # Keyed by DB pk (never changes) so match ID changes
                                                 # from snooker.org don't break resume detection
+        self._schedule = []                     # heap of (next_run_at, IDLE_JOBS index)
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -75,6 +150,7 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
+        self.verbosity = options.get('verbosity', 1)
         active_interval = options.get('active_interval', 120)
         sleep_interval = options.get('sleep_interval', 900)
         
@@ -97,8 +173,15 @@ class Command(BaseCommand):
         # On startup: sync current season events + import any missing match data
         self._startup_sync()
 
+        # Every idle job is due immediately on boot so a restart inside a
+        # job's window still runs it; afterwards each is re-armed for its
+        # next boundary.
+        self._init_schedule(timezone.now())
+
         while not self.should_stop:
             try:
+                # One clock read per tick, passed to every check so no two
+                # checks in the same tick can straddle an hour/day boundary
                 current_time = timezone.now()
                 self.stdout.write(f'[CHECK] Checking at {current_time.strftime("%Y-%m-%d %H:%M:%S")}')
                 
@@ -110,15 +193,15 @@ class Command(BaseCommand):
                     self._run_live_updates()
 
                     # During active tournaments: smart career history sync at 4-5am UTC
-                    if self._check_player_history_update():
+                    if self._check_player_history_update(current_time):
                         self.stdout.write('[AUTOMATION] Player history update completed')
 
                     # During active tournaments: centuries + player stats at 2-3am UTC
-                    if self._check_nightly_active_updates():
+                    if self._check_nightly_active_updates(current_time):
                         self.stdout.write('[AUTOMATION] Nightly active-tour stats update completed')
 
                     # 1 day before tournament starts: backfill new players only
-                    if self._check_pretournament_update():
+                    if self._check_pretournament_update(current_time):
                         self.stdout.write('[AUTOMATION] Pre-tournament new-player sync completed')
 
                     # Use short interval during active periods
@@ -129,28 +212,19 @@ class Command(BaseCommand):
                     
                     # Update upcoming matches as fallback when no active tournaments
                     self._update_upcoming_matches_fallback()
-                    
-                    # Check for scheduled daily updates (3am UTC)
-                    if self._check_daily_updates():
-                        self.stdout.write('[AUTOMATION] Daily updates completed')
-                    
-                    # Check for scheduled monthly updates (1st of month, 3am UTC)
-                    if self._check_monthly_updates():
-                        self.stdout.write('[AUTOMATION] Monthly updates completed')
-                    
-                    # Check for upcoming tournaments needing match data (every 4 hours)
-                    if self._check_upcoming_tournament_updates():
-                        self.stdout.write('[AUTOMATION] Upcoming tournament updates completed')
-                    
-                    # Check for recently finished tournaments needing final updates
-                    if self._check_tournament_end_updates():
-                        self.stdout.write('[AUTOMATION] Tournament end updates completed')
-                    
-                    next_check = sleep_interval
+
+                    # Daily (2-4am UTC), monthly (1st, 2-4am UTC), upcoming
+                    # tournaments (even hours) and tournament-end checks —
+                    # only the ones whose next run time has come
+                    self._run_due_jobs(current_time)
+
+                    # Wake for the next due job rather than a fixed tick;
+                    # sleep_interval still caps it so new activity is noticed
+                    next_check = self._idle_sleep_seconds(timezone.now(), sleep_interval)
                     self.stdout.write(f'[TIMER] Next check in {next_check//60} minutes')
                 
                 # Fetch news every 2 hours regardless of tournament state
-                self._check_news_fetch()
+                self._check_news_fetch(current_time)
 
                 # Reset error count on successful run
                 self.error_count = 0
@@ -175,10 +249,32 @@ class Command(BaseCommand):
                 self.stdout.write(f'[WAIT] Sleeping {error_sleep}s due to error')
                 time.sleep(error_sleep)
 
+    def _init_schedule(self, now):
+        """Arm every idle job to fire on the next idle tick."""
+        self._schedule = [(now, i) for i in range(len(self.IDLE_JOBS))]
+        heapq.heapify(self._schedule)
+
+    def _run_due_jobs(self, now):
+        """Run idle jobs whose next_run_at has passed, then re-arm them."""
+        while self._schedule and self._schedule[0][0] <= now:
+            _, i = heapq.heappop(self._schedule)
+            method_name, next_run, done_msg = self.IDLE_JOBS[i]
+            try:
+                if getattr(self, method_name)(now):
+                    self.stdout.write(done_msg)
+            finally:
+                heapq.heappush(self._schedule, (next_run(now), i))
+
+    def _idle_sleep_seconds(self, now, cap):
+        """Seconds until the earliest scheduled idle job, at most ``cap``."""
+        if not self._schedule:
+            return cap
+        until_due = (self._schedule[0][0] - now).total_seconds()
+        return max(1, min(cap, int(until_due)))
+
     def _startup_sync(self):
         """On startup: import current season events + any missing match data."""
         try:
-            from oneFourSeven.constants import current_season_int
             self.stdout.write('[STARTUP] Syncing current season events...')
             call_command('update_tournaments', '--season', str(current_season_int()), '--tour', 'main')
             self.stdout.write('[STARTUP] Season events synced')
@@ -188,7 +284,7 @@ class Command(BaseCommand):
 
         try:
             self.stdout.write('[STARTUP] Importing matches for events with no data...')
-            call_command('update_matches', '--empty-only')
+            run_update_matches(empty_only=True, stdout=self.stdout)
             self.stdout.write('[STARTUP] Missing match data imported')
         except Exception as e:
             logger.error(f'Startup match import failed: {e}')
@@ -203,7 +299,6 @@ class Command(BaseCommand):
             self.stdout.write(f'[STARTUP] Player history sync failed: {e}')
 
         try:
-            from oneFourSeven.models import PlayerCareerStats
             populated = PlayerCareerStats.objects.count()
             if populated < 50:
                 self.stdout.write(
@@ -223,36 +318,29 @@ class Command(BaseCommand):
         """Check if there are any tournaments currently in their date range."""
         today = current_time.date()
 
-        # A tournament is "active" if today falls within its start/end dates
-        active_tournaments = Event.objects.filter(
-            StartDate__lte=today,
-            EndDate__gte=today
-        )
-
-        if active_tournaments.exists():
-            for event in active_tournaments:
-                self.stdout.write(f'[MATCH] Active tournament found: {event.Name} (ID: {event.ID})')
-            return True
-
-        # Also check tournaments that ended yesterday (matches can run late)
+        # A tournament is "active" if today falls within its start/end dates;
+        # tournaments that ended yesterday count too (matches can run late).
+        # One EXISTS probe covers both - this runs on every poll.
         yesterday = today - timedelta(days=1)
-        recent_tournaments = Event.objects.filter(
+        active_tournaments = Event.objects.filter(
             StartDate__lte=today,
             EndDate__gte=yesterday
         )
 
-        if recent_tournaments.exists():
-            for event in recent_tournaments:
-                self.stdout.write(f'[MATCH] Recent tournament found: {event.Name} (ID: {event.ID})')
-            return True
+        if self.verbosity > 1:
+            found = list(active_tournaments.values_list('ID', 'Name'))
+            for event_id, name in found:
+                self.stdout.write(f'[MATCH] Active tournament found: {name} (ID: {event_id})')
+            return bool(found)
 
-        return False
+        return active_tournaments.exists()
 
     def _run_live_updates(self):
         """Run the live match update command."""
         try:
-            # Run live match updates for all tournaments
-            call_command('update_live_matches', '--max-events', '10')
+            # Run live match updates for all tournaments. Called in-process
+            # (not via call_command) since this fires every active_interval.
+            run_live_matches(max_events=10, stdout=self.stdout)
             self.stdout.write('[SUCCESS] Live updates completed')
         except Exception as e:
             logger.error(f'Failed to run live updates: {str(e)}')
@@ -271,8 +359,6 @@ class Command(BaseCommand):
         Called after each live update cycle. All errors are caught — never blocks updates.
         """
         try:
-            from oneFourSeven.models import MatchesOfAnEvent, Player, NotifDedup
-            from oneFourSeven.push_notifications import send_expo_push, get_tokens_for_match, get_tokens_for_match_db_id, get_tokens_for_player
 
             today = timezone.now().date()
             # Clean up dedup rows older than today (runs cheaply — indexed on sent_date)
@@ -497,13 +583,13 @@ class Command(BaseCommand):
             logger.error(f'[NOTIFY] Push notification error (non-fatal): {e}')
             self.stdout.write(f'[NOTIFY] Error (non-fatal): {e}')
     
-    def _check_player_history_update(self) -> bool:
+    def _check_player_history_update(self, current_time=None) -> bool:
         """
         During active tournaments: smart career history sync at 4-5am UTC.
         Full backfill for new top-128 entrants; current season only for existing players.
         Runs once per day when a tournament is active.
         """
-        current_time = timezone.now()
+        current_time = current_time or timezone.now()
 
         # 4-5am UTC window
         if 4 <= current_time.hour <= 5:
@@ -521,13 +607,13 @@ class Command(BaseCommand):
 
         return False
 
-    def _check_nightly_active_updates(self) -> bool:
+    def _check_nightly_active_updates(self, current_time=None) -> bool:
         """
         During active tournaments: run century stats + player stats at 2-3 AM UTC.
         Targets only players with matches today (smart targeting).
         Runs once per day.
         """
-        current_time = timezone.now()
+        current_time = current_time or timezone.now()
 
         # 2-3 AM UTC window
         if 2 <= current_time.hour <= 3:
@@ -561,14 +647,14 @@ class Command(BaseCommand):
 
         return False
 
-    def _check_pretournament_update(self) -> bool:
+    def _check_pretournament_update(self, current_time=None) -> bool:
         """
         1 day before a tournament starts: backfill career history for new top-128 players only.
         Skips existing players (fast). Deduped per event ID.
         """
         try:
-            tomorrow = (timezone.now() + timedelta(days=1)).date()
-            upcoming = Event.objects.filter(StartDate=tomorrow)
+            tomorrow = ((current_time or timezone.now()) + timedelta(days=1)).date()
+            upcoming = Event.objects.filter(StartDate=tomorrow).only('ID', 'Name')
             for event in upcoming:
                 if event.ID not in self.pretournament_processed:
                     self.stdout.write(
@@ -589,17 +675,25 @@ class Command(BaseCommand):
     def _update_upcoming_matches_fallback(self):
         """Update upcoming matches as fallback when no active tournaments."""
         try:
-            from django.utils import timezone
-            from oneFourSeven.models import UpcomingMatch
-            
+            now = timezone.now()
+
+            # Seed once per process from the newest row; after that only our own
+            # update_upcoming_matches runs move it, so ticks don't query at all
+            if self.upcoming_last_updated is None:
+                self.upcoming_last_updated = UpcomingMatch.objects.aggregate(
+                    latest=Max('created_at')
+                )['latest']
+
             # Check if we need to update upcoming matches (every 4 hours)
-            recent_update = UpcomingMatch.objects.filter(
-                created_at__gte=timezone.now() - timedelta(hours=4)
-            ).exists()
+            recent_update = (
+                self.upcoming_last_updated is not None
+                and now - self.upcoming_last_updated < timedelta(hours=4)
+            )
             
             if not recent_update:
                 self.stdout.write('[FALLBACK] Updating upcoming matches - no recent data')
                 call_command('update_upcoming_matches', '--tour', 'main')
+                self.upcoming_last_updated = now
                 self.stdout.write('[SUCCESS] Upcoming matches fallback updated')
             else:
                 self.stdout.write('[SKIP] Upcoming matches fallback recent - skipping')
@@ -608,9 +702,9 @@ class Command(BaseCommand):
             logger.error(f'Failed to update upcoming matches fallback: {str(e)}')
             self.stdout.write(f'[FAILED] Upcoming matches fallback failed: {str(e)}')
 
-    def _check_daily_updates(self):
+    def _check_daily_updates(self, current_time=None):
         """Check if daily updates should run (3am UTC)."""
-        current_time = timezone.now()
+        current_time = current_time or timezone.now()
 
         # Check if it's around 3am UTC (within 1 hour window)
         if 2 <= current_time.hour <= 4:
@@ -618,9 +712,15 @@ class Command(BaseCommand):
 
             # Use instance variable to track last run - avoids querying missing fields
             if self.last_daily_run != today:
+                # Persisted marker (PK lookup) so a restart in the window doesn't rerun
+                day_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+                if self._job_ran_since(ScheduledJobRun.DAILY, day_start):
+                    self.last_daily_run = today
+                    return False
                 self.stdout.write('[DAILY] Running daily updates at 3am...')
                 self._run_daily_updates()
                 self.last_daily_run = today
+                self._record_job_run(ScheduledJobRun.DAILY, current_time)
                 return True
 
         return False
@@ -631,11 +731,11 @@ class Command(BaseCommand):
             self.stdout.write('[DAILY] Starting daily matches and round updates...')
 
             # Update active tournaments
-            call_command('update_matches', '--active-only')
+            run_update_matches(active_only=True, stdout=self.stdout)
             self.stdout.write('[SUCCESS] Daily matches updated')
 
             # Import matches for any event in DB that has zero match data (any season)
-            call_command('update_matches', '--empty-only')
+            run_update_matches(empty_only=True, stdout=self.stdout)
             self.stdout.write('[SUCCESS] Empty events import done')
 
             # Update round details for the current season (top 10 most recent events)
@@ -666,9 +766,9 @@ class Command(BaseCommand):
             logger.error(f'Daily updates failed: {str(e)}')
             self.stdout.write(f'[FAILED] Daily updates failed: {str(e)}')
 
-    def _check_monthly_updates(self):
+    def _check_monthly_updates(self, current_time=None):
         """Check if monthly updates should run (1st of month)."""
-        current_time = timezone.now()
+        current_time = current_time or timezone.now()
 
         # Check if it's the 1st day of the month and early morning
         if current_time.day == 1 and 2 <= current_time.hour <= 4:
@@ -676,12 +776,28 @@ class Command(BaseCommand):
             this_month = current_time.strftime('%Y-%m')
 
             if self.last_monthly_run != this_month:
+                month_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+                if self._job_ran_since(ScheduledJobRun.MONTHLY, month_start):
+                    self.last_monthly_run = this_month
+                    return False
                 self.stdout.write('[MONTHLY] Running monthly full updates...')
                 self._run_monthly_updates()
                 self.last_monthly_run = this_month
+                self._record_job_run(ScheduledJobRun.MONTHLY, current_time)
                 return True
 
         return False
+
+    def _job_ran_since(self, job_name, since):
+        """True if ``job_name`` has a persisted run at or after ``since``."""
+        return ScheduledJobRun.objects.filter(job_name=job_name, last_run__gte=since).exists()
+
+    def _record_job_run(self, job_name, when):
+        """Persist a completed run; failure only costs a possible rerun after restart."""
+        try:
+            ScheduledJobRun.objects.update_or_create(job_name=job_name, defaults={'last_run': when})
+        except Exception as e:
+            logger.error(f'Failed to record {job_name} run: {e}')
     
     def _run_monthly_updates(self):
         """Run monthly comprehensive updates."""
@@ -689,13 +805,11 @@ class Command(BaseCommand):
             self.stdout.write('[MONTHLY] Starting monthly comprehensive updates...')
 
             # Update tournaments for current season
-            from oneFourSeven.constants import current_season_int
             call_command('update_tournaments', '--season', str(current_season_int()), '--tour', 'main')
             self.stdout.write('[SUCCESS] Monthly tournaments updated')
             
             # Update players
-            call_command('update_players', '--status', 'pro', '--sex', 'men')
-            call_command('update_players', '--status', 'pro', '--sex', 'women')
+            call_command('update_players', '--status', 'pro', '--sex', 'men', 'women')
             self.stdout.write('[SUCCESS] Monthly players updated')
             
             # Update all ranking types (MoneyRankings, QTRankings, WomensRankings, etc.)
@@ -714,37 +828,36 @@ class Command(BaseCommand):
             logger.error(f'Monthly updates failed: {str(e)}')
             self.stdout.write(f'[FAILED] Monthly updates failed: {str(e)}')
     
-    def _check_upcoming_tournament_updates(self):
+    def _check_upcoming_tournament_updates(self, current_time=None):
         """Check if upcoming tournaments need match/round data updates (every 4 hours)."""
-        current_time = timezone.now()
+        current_time = current_time or timezone.now()
         
         # Only run every 2 hours (check if current hour is divisible by 2) - more frequent updates
         if current_time.hour % 2 != 0:
             return False
         
-        # Check if we already ran this hour
-        from oneFourSeven.models import Event, MatchesOfAnEvent, RoundDetails
+        # Wall-clock guards come first: at most one DB check per even hour
+        this_hour = current_time.replace(minute=0, second=0, microsecond=0)
+        if self.last_upcoming_check == this_hour:
+            return False
+        self.last_upcoming_check = this_hour
         
         # Find upcoming tournaments in next 1-7 days without match data
         upcoming_start = current_time.date() + timedelta(days=1)
         upcoming_end = current_time.date() + timedelta(days=7)
         
+        # Tournament needs update if it has no matches, or if matches exist but
+        # none have a ScheduledDate — both mean "no scheduled match EXISTS"
         upcoming_tournaments = Event.objects.filter(
             StartDate__gte=upcoming_start,
             StartDate__lte=upcoming_end
+        ).exclude(
+            Exists(MatchesOfAnEvent.objects.filter(
+                Event=OuterRef('pk'), ScheduledDate__isnull=False
+            ))
         )
         
-        tournaments_needing_update = []
-        for tournament in upcoming_tournaments:
-            match_count = MatchesOfAnEvent.objects.filter(Event=tournament).count()
-            round_count = RoundDetails.objects.filter(Event=tournament).count()
-            
-            # Tournament needs update if it has no matches, or if matches exist but none have a ScheduledDate
-            scheduled_count = MatchesOfAnEvent.objects.filter(
-                Event=tournament, ScheduledDate__isnull=False
-            ).count()
-            if match_count == 0 or scheduled_count == 0:
-                tournaments_needing_update.append(tournament)
+        tournaments_needing_update = list(upcoming_tournaments.iterator(chunk_size=100))
         
         if tournaments_needing_update:
             self.stdout.write(f'[UPCOMING] Found {len(tournaments_needing_update)} tournaments needing data updates')
@@ -755,49 +868,75 @@ class Command(BaseCommand):
     
     def _run_upcoming_tournament_updates(self, tournaments):
         """Update match and round data for upcoming tournaments."""
+        # Tournaments are updated on a small pool: the shared API client hands
+        # out request slots 30s apart, so one worker's DB writes overlap the
+        # next worker's wait rather than adding to it. More workers would only
+        # queue on the rate limit.
+        pool = ThreadPoolExecutor(max_workers=self.UPCOMING_UPDATE_WORKERS)
         try:
-            for tournament in tournaments:
-                self.stdout.write(f'[UPCOMING] Updating {tournament.Name} (ID: {tournament.ID})')
-                
-                # Try to update matches first
-                try:
-                    call_command('update_matches', '--event-id', str(tournament.ID))
-                    self.stdout.write(f'[SUCCESS] Updated matches for {tournament.Name}')
-                except Exception as e:
-                    self.stdout.write(f'[INFO] No matches yet for {tournament.Name}: {str(e)}')
-                
-                # Try to update round details
-                try:
-                    call_command('update_round_details', '--event-id', str(tournament.ID))
-                    self.stdout.write(f'[SUCCESS] Updated round details for {tournament.Name}')
-                except Exception as e:
-                    self.stdout.write(f'[INFO] No round details yet for {tournament.Name}: {str(e)}')
-                
-                # Try to update prize money
+            futures = {
+                pool.submit(self._update_upcoming_tournament, tournament): tournament
+                for tournament in tournaments
+            }
+            for future in as_completed(futures):
                 try:
-                    call_command('update_prize_money', '--event-id', str(tournament.ID))
-                    self.stdout.write(f'[SUCCESS] Updated prize money for {tournament.Name}')
-                except Exception as e:
-                    self.stdout.write(f'[INFO] No prize money yet for {tournament.Name}: {str(e)}')
-                
-                # Small delay between tournaments to respect API limits
-                import time
-                time.sleep(2)
+                    future.result()
+                except RateLimited as e:
+                    # A 429 or an outage stops this batch rather than
+                    # hammering the API for every remaining tournament
+                    for pending in futures:
+                        pending.cancel()
+                    self.stdout.write(f'[RATE_LIMIT] API rate limited, backing off {e.retry_after}s')
+                    time.sleep(e.retry_after)
+                    break
+                except ServerError:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
                 
         except Exception as e:
             logger.error(f'Upcoming tournament updates failed: {str(e)}')
             self.stdout.write(f'[FAILED] Upcoming tournament updates failed: {str(e)}')
+        finally:
+            pool.shutdown(wait=True)
+
+    def _update_upcoming_tournament(self, tournament):
+        """Pool worker: matches, round details and prize money for one tournament."""
+        try:
+            self.stdout.write(f'[UPCOMING] Updating {tournament.Name} (ID: {tournament.ID})')
+            
+            # Try to update matches first. update_matches classifies API
+            # failures; RateLimited/ServerError propagate to the caller.
+            try:
+                run_update_matches(event_id=tournament.ID, stdout=self.stdout)
+                self.stdout.write(f'[SUCCESS] Updated matches for {tournament.Name}')
+            except NoDataYet as e:
+                self.stdout.write(f'[INFO] No matches yet for {tournament.Name}: {str(e)}')
+            except (RateLimited, ServerError):
+                raise
+            except Exception as e:
+                self.stdout.write(f'[INFO] No matches yet for {tournament.Name}: {str(e)}')
+            
+            # Try to update round details
+            try:
+                call_command('update_round_details', '--event-id', str(tournament.ID))
+                self.stdout.write(f'[SUCCESS] Updated round details for {tournament.Name}')
+            except Exception as e:
+                self.stdout.write(f'[INFO] No round details yet for {tournament.Name}: {str(e)}')
+            
+            # Try to update prize money
+            try:
+                call_command('update_prize_money', '--event-id', str(tournament.ID))
+                self.stdout.write(f'[SUCCESS] Updated prize money for {tournament.Name}')
+            except Exception as e:
+                self.stdout.write(f'[INFO] No prize money yet for {tournament.Name}: {str(e)}')
+        finally:
+            # Worker threads get their own DB connection; don't leak it
+            connection.close()
     
-    def _check_tournament_end_updates(self):
+    def _check_tournament_end_updates(self, current_time=None):
         """Check for recently finished tournaments that need ranking and player updates."""
-        current_time = timezone.now()
-        
-        # Find tournaments that ended in the last 48 hours
-        end_cutoff = current_time - timedelta(hours=48)
-        recently_ended = Event.objects.filter(
-            EndDate__gte=end_cutoff,
-            EndDate__lt=current_time
-        )
+        current_time = current_time or timezone.now()
         
         # Clean up old processed tournament IDs (older than 7 days)
         old_cutoff = current_time - timedelta(days=7)
@@ -809,22 +948,20 @@ class Command(BaseCommand):
         for old_id in old_tournaments:
             self.processed_tournament_ends.discard(old_id)
         
-        # Check if we have tournaments that ended and might need final updates
-        tournaments_needing_final_updates = []
-        for tournament in recently_ended:
-            # Skip if already processed
-            if tournament.ID in self.processed_tournament_ends:
-                continue
-                
-            # Check if this tournament has finished matches (status 3)
-            finished_matches = MatchesOfAnEvent.objects.filter(
-                Event=tournament,
-                Status=3  # Finished
-            ).count()
-            
-            # If tournament has finished matches, it probably ended
-            if finished_matches > 0:
-                tournaments_needing_final_updates.append(tournament)
+        # Tournaments that ended in the last 48 hours, not yet processed, with
+        # at least one finished (status 3) match — EXISTS stops at the first hit
+        # instead of counting every match. Only ID/Name/Tour are read downstream.
+        end_cutoff = current_time - timedelta(hours=48)
+        recently_ended = Event.objects.filter(
+            EndDate__gte=end_cutoff,
+            EndDate__lt=current_time
+        ).exclude(
+            ID__in=list(self.processed_tournament_ends)
+        ).filter(
+            Exists(MatchesOfAnEvent.objects.filter(Event=OuterRef('pk'), Status=3))
+        ).only('ID', 'Name', 'Tour', 'EndDate')
+        
+        tournaments_needing_final_updates = list(recently_ended.iterator(chunk_size=100))
         
         if tournaments_needing_final_updates:
             self.stdout.write(f'[TOUR_END] Found {len(tournaments_needing_final_updates)} recently ended tournaments')
@@ -835,60 +972,34 @@ class Command(BaseCommand):
     
     def _run_tournament_end_updates(self, tournaments):
         """Run comprehensive updates after tournament ends - rankings and players."""
+        pro_sexes = set()
+        update_amateurs = False
         try:
             for tournament in tournaments:
                 self.stdout.write(f'[TOUR_END] Processing end updates for {tournament.Name} (ID: {tournament.ID})')
                 
-                # Update all ranking types after tournament ends
-                ranking_types = [
-                    'MoneyRankings',
-                    'WorldRankings', 
-                    'OneYearRanking',
-                    'OneYearMoneyRankings',
-                    'MoneySeedings',
-                    'QTRankings'
-                ]
-                
-                # Add women's rankings if applicable
-                if tournament.Tour in ['womens', 'main']:
-                    ranking_types.append('WomensRankings')
-                
-                # Add amateur rankings if applicable  
-                if tournament.Tour in ['amateur', 'other']:
-                    ranking_types.append('AmateurRankings')
-                
-                # Update each ranking type
-                for ranking_type in ranking_types:
+                # Update each ranking type relevant to this tour
+                for ranking_type in _ranking_types_for_tour(tournament.Tour):
                     try:
                         self.stdout.write(f'[RANKINGS] Updating {ranking_type} after {tournament.Name}')
                         call_command('update_rankings', '--ranking-type', ranking_type, '--current-season-only')
                         self.stdout.write(f'[SUCCESS] Updated {ranking_type}')
                         
                         # Small delay between ranking updates
-                        import time
                         time.sleep(3)
                         
                     except Exception as e:
                         self.stdout.write(f'[WARNING] Failed to update {ranking_type}: {str(e)}')
                         # Continue with other ranking types
                 
-                # Update players (might have new data after tournament)
-                try:
-                    self.stdout.write(f'[PLAYERS] Updating players after {tournament.Name}')
-
-                    # Update different player categories based on tournament type
-                    if tournament.Tour == 'womens':
-                        call_command('update_players', '--status', 'pro', '--sex', 'women')
-                    elif tournament.Tour == 'amateur':
-                        call_command('update_players', '--status', 'amateur')
-                    else:
-                        # Main tour - update professional men
-                        call_command('update_players', '--status', 'pro', '--sex', 'men')
-
-                    self.stdout.write(f'[SUCCESS] Updated players after {tournament.Name}')
-
-                except Exception as e:
-                    self.stdout.write(f'[WARNING] Failed to update players: {str(e)}')
+                # Collect player categories; fetched once for all tournaments below
+                if tournament.Tour == 'womens':
+                    pro_sexes.add('women')
+                elif tournament.Tour == 'amateur':
+                    update_amateurs = True
+                else:
+                    # Main tour - update professional men
+                    pro_sexes.add('men')
 
                 # Smart career history sync: full backfill for new top-128 entrants, current season for existing
                 try:
@@ -902,9 +1013,21 @@ class Command(BaseCommand):
                 self.processed_tournament_ends.add(tournament.ID)
                 
                 # Delay between tournaments to respect API limits
-                import time
-                from oneFourSeven.constants import MIN_REQUEST_INTERVAL
                 time.sleep(MIN_REQUEST_INTERVAL)
+
+            # Update players (might have new data after tournament) - one
+            # update_players run per status, covering every tour that ended
+            try:
+                if pro_sexes:
+                    self.stdout.write(f'[PLAYERS] Updating pro players ({", ".join(sorted(pro_sexes))})')
+                    call_command('update_players', '--status', 'pro', '--sex', *sorted(pro_sexes))
+                if update_amateurs:
+                    self.stdout.write('[PLAYERS] Updating amateur players')
+                    call_command('update_players', '--status', 'amateur')
+                if pro_sexes or update_amateurs:
+                    self.stdout.write('[SUCCESS] Updated players after tournament end')
+            except Exception as e:
+                self.stdout.write(f'[WARNING] Failed to update players: {str(e)}')
                 
         except Exception as e:
             logger.error(f'Tournament end updates failed: {str(e)}')
@@ -924,9 +1047,9 @@ class Command(BaseCommand):
             logger.error(f'fetch_frame_scores error (non-fatal): {e}')
             self.stdout.write(f'[FRAMES] Error (non-fatal): {e}')
 
-    def _check_news_fetch(self):
+    def _check_news_fetch(self, current_time=None):
         """Fetch news from RSS feeds every 2 hours."""
-        current_time = timezone.now()
+        current_time = current_time or timezone.now()
         if (self.last_news_fetch is None or
                 (current_time - self.last_news_fetch).total_seconds() >= 7200):
             self.stdout.write('[NEWS] Fetching news from RSS feeds...')
@@ -11,12 +11,14 @@ Usage: python manage.py cleanup_duplicate_matches --dry-run
 
 import logging
 from django.core.management.base import BaseCommand
-from django.db.models import Q, Count
+from django.db import transaction
+from django.db.models import Q, Count, Exists, OuterRef
+from django.utils import timezone
 from oneFourSeven.models import MatchesOfAnEvent
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import timedelta
+from itertools import groupby
+from operator import itemgetter
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -56,27 +58,32 @@ class Command(BaseCommand):
         duplicate_count = duplicates.count()
         self.stdout.write(f'[FOUND] {duplicate_count} sets of duplicate matches (same Event/Round/Number)')
 
-        for dup_group in duplicates:
-            event_id = dup_group['Event']
-            round_num = dup_group['Round']
-            number = dup_group['Number']
+        # Pull exactly the rows that share their (Event, Round, Number) with
+        # another row, in one query (ids + player ids only), and group them in
+        # Python instead of re-querying each duplicate group
+        has_twin = MatchesOfAnEvent.objects.filter(
+            Event=OuterRef('Event'), Round=OuterRef('Round'), Number=OuterRef('Number')
+        ).exclude(pk=OuterRef('pk'))
+        candidate_rows = MatchesOfAnEvent.objects.filter(
+            Exists(has_twin)
+        ).order_by('Event', 'Round', 'Number', 'id').values(
+            'id', 'Event', 'Round', 'Number', 'Player1ID', 'Player2ID'
+        )
 
-            # Get all matches in this duplicate group
-            matches = MatchesOfAnEvent.objects.filter(
-                Event_id=event_id,
-                Round=round_num,
-                Number=number
-            ).order_by('id')
+        ids_to_delete = []
 
+        for (event_id, round_num, number), group in groupby(
+            candidate_rows.iterator(), key=itemgetter('Event', 'Round', 'Number')
+        ):
             # Separate into real and TBD matches
             real_matches = []
             tbd_matches = []
 
-            for match in matches:
-                if match.Player1ID == 376 or match.Player2ID == 376:
-                    tbd_matches.append(match)
+            for match in group:
+                if match['Player1ID'] == 376 or match['Player2ID'] == 376:
+                    tbd_matches.append(match['id'])
                 else:
-                    real_matches.append(match)
+                    real_matches.append(match['id'])
 
             # Decision logic
             if len(real_matches) > 0 and len(tbd_matches) > 0:
@@ -85,28 +92,15 @@ class Command(BaseCommand):
                     f'  Event {event_id}, Round {round_num}, Number {number}: '
                     f'{len(real_matches)} real + {len(tbd_matches)} TBD → Deleting TBD'
                 )
-
-                if not dry_run:
-                    for tbd_match in tbd_matches:
-                        tbd_match.delete()
-                        total_deleted += 1
-                else:
-                    total_deleted += len(tbd_matches)
+                ids_to_delete.extend(tbd_matches)
 
             elif len(real_matches) > 1:
-                # Multiple real matches - keep the latest updated, delete others
+                # Multiple real matches - keep the first, delete others
                 self.stdout.write(
                     f'  Event {event_id}, Round {round_num}, Number {number}: '
                     f'{len(real_matches)} real matches → Keeping 1, deleting {len(real_matches)-1}'
                 )
-
-                if not dry_run:
-                    # Keep the first, delete the rest
-                    for match in real_matches[1:]:
-                        match.delete()
-                        total_deleted += 1
-                else:
-                    total_deleted += len(real_matches) - 1
+                ids_to_delete.extend(real_matches[1:])
 
             elif len(tbd_matches) > 1:
                 # Multiple TBD matches - keep one, delete others
@@ -114,13 +108,13 @@ class Command(BaseCommand):
                     f'  Event {event_id}, Round {round_num}, Number {number}: '
                     f'{len(tbd_matches)} TBD matches → Keeping 1, deleting {len(tbd_matches)-1}'
                 )
+                ids_to_delete.extend(tbd_matches[1:])
 
-                if not dry_run:
-                    for match in tbd_matches[1:]:
-                        match.delete()
-                        total_deleted += 1
-                else:
-                    total_deleted += len(tbd_matches) - 1
+        if not dry_run and ids_to_delete:
+            # One DELETE for the whole step
+            with transaction.atomic():
+                MatchesOfAnEvent.objects.filter(id__in=ids_to_delete).delete()
+        total_deleted += len(ids_to_delete)
 
         # ============================================================
         # STEP 2: Find TBD matches in FINISHED status (shouldn't exist in Results)
@@ -134,16 +128,22 @@ class Command(BaseCommand):
             (Q(Player1ID=376) | Q(Player2ID=376))  # Has TBD players
         )
 
-        tbd_finished_count = tbd_finished.count()
+        # Preview rows first (one past the display limit): on a clean DB this
+        # single small query is all step 2 costs, and COUNT only runs when
+        # there are more rows than the preview shows
+        preview = list(tbd_finished.values(
+            'id', 'Event__Name', 'Round', 'Number', 'Player1ID', 'Player2ID'
+        )[:11])
+        tbd_finished_count = len(preview) if len(preview) <= 10 else tbd_finished.count()
         self.stdout.write(f'[FOUND] {tbd_finished_count} TBD matches with finished status (garbage)')
 
         if tbd_finished_count > 0:
-            # Show details
-            for match in tbd_finished[:10]:
+            # Show details (only the printed columns, Event name via the JOIN)
+            for m in preview[:10]:
                 self.stdout.write(
-                    f'  Match ID {match.id}: Event={match.Event.Name}, '
-                    f'Round={match.Round}, Number={match.Number}, '
-                    f'P1={match.Player1ID}, P2={match.Player2ID}'
+                    f'  Match ID {m["id"]}: Event={m["Event__Name"]}, '
+                    f'Round={m["Round"]}, Number={m["Number"]}, '
+                    f'P1={m["Player1ID"]}, P2={m["Player2ID"]}'
                 )
 
             if tbd_finished_count > 10:
@@ -163,24 +163,29 @@ class Command(BaseCommand):
 
         self.stdout.write('\n[STEP 3] Finding old TBD matches in Upcoming...')
 
-        cutoff_date = datetime.now() - timedelta(hours=6)
+        # Aware cutoff: ScheduledDate is a timezone-aware column (USE_TZ=True)
+        cutoff_date = timezone.now() - timedelta(hours=6)
 
+        # Status=0 + ScheduledDate range is served by the moe_live_status_idx
+        # partial index (Status IN 0,1,2), which these rows then leave
         bad_matches = MatchesOfAnEvent.objects.filter(
             Q(Status=0) &  # Upcoming status
             Q(ScheduledDate__lt=cutoff_date) &  # But date is past
             (Q(Player1ID=376) | Q(Player2ID=376))  # And has TBD players
         )
 
-        count = bad_matches.count()
-        self.stdout.write(f'[FOUND] {count} old TBD matches in Upcoming')
-
-        if count > 0:
-            if not dry_run:
+        if dry_run:
+            count = bad_matches.count()
+            self.stdout.write(f'[FOUND] {count} old TBD matches in Upcoming')
+            total_updated += count
+        else:
+            # UPDATE's row count doubles as the FOUND count - no separate COUNT
+            with transaction.atomic():
                 updated = bad_matches.update(Status=3)
+            self.stdout.write(f'[FOUND] {updated} old TBD matches in Upcoming')
+            if updated > 0:
                 self.stdout.write(f'[UPDATED] {updated} matches to finished status')
-                total_updated += updated
-            else:
-                total_updated += count
+            total_updated += updated
 
         # ============================================================
         # SUMMARY
@@ -14,26 +14,37 @@ WHAT IT DOES:
 This solves ALL your automation needs in one command.
 """
 
+import signal
+import subprocess
+import sys
 import threading
-import time
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
 from django.utils import timezone
-import pytz
 import logging
 
 # Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class Command(BaseCommand):
     help = 'Comprehensive automation system for the entire snooker app'
 
+    # A job whose trigger passed less than this long ago still runs at startup
+    JOB_WINDOW = timedelta(minutes=15)
+    # How often the supervisor checks that the live scheduler process is alive
+    LIVE_SUPERVISE_INTERVAL = 30
+    # Scheduler error retry: starts short, doubles while errors persist
+    ERROR_WAIT_MIN = 5
+    ERROR_WAIT_MAX = 3600
+
     def __init__(self):
         super().__init__()
-        self.should_stop = False
-        self.israel_tz = pytz.timezone('Asia/Jerusalem')
+        self._stop_event = threading.Event()
+        self._previous_sigterm = None
+        self.israel_tz = ZoneInfo('Asia/Jerusalem')
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -65,61 +76,138 @@ class Command(BaseCommand):
         # Schedule all the tasks
         self._schedule_all_tasks()
         
+        # SIGTERM wakes the scheduler thread immediately instead of leaving it
+        # mid-sleep (signal handlers can only be installed from the main thread)
+        if threading.current_thread() is threading.main_thread():
+            self._previous_sigterm = signal.signal(signal.SIGTERM, self._handle_sigterm)
+        
         # Start the scheduler in a separate thread
         scheduler_thread = threading.Thread(target=self._run_scheduler)
         scheduler_thread.daemon = True
         scheduler_thread.start()
         
-        # Start live monitoring (this will be the main thread)
-        self._start_live_monitoring()
+        # Live monitoring runs in its own process; the main thread just
+        # supervises it until SIGTERM
+        self._supervise_live_monitoring()
 
     def _schedule_all_tasks(self):
-        """Schedule all automated tasks using simple time-based checks"""
+        """Schedule all automated tasks as absolute next-trigger times"""
         self.stdout.write('📅 Setting up task scheduling...')
         
-        # Store last run times
-        self.last_daily_run = None
-        self.last_weekly_run = None
-        self.last_monthly_run = None
+        now = datetime.now(self.israel_tz)
+        today = now.date()
+        
+        # Daily: 06:00 Israel time
+        self._next_daily = self._local_time(today, 6)
+        # Weekly: Sunday 05:00 Israel time
+        self._next_weekly = self._local_time(today + timedelta(days=(6 - today.weekday()) % 7), 5)
+        # Monthly: 1st of month 04:00 Israel time
+        self._next_monthly = self._local_time(today.replace(day=1), 4)
+        
+        # Triggers already past their window wait for the next occurrence
+        if now >= self._next_daily + self.JOB_WINDOW:
+            self._next_daily += timedelta(days=1)
+        if now >= self._next_weekly + self.JOB_WINDOW:
+            self._next_weekly += timedelta(days=7)
+        if now >= self._next_monthly + self.JOB_WINDOW:
+            self._next_monthly = self._next_month(self._next_monthly)
         
         self.stdout.write('✅ Task scheduling configured')
 
+    def _handle_sigterm(self, signum, frame):
+        """Stop the scheduler, then let the previous SIGTERM behaviour run"""
+        self._stop_event.set()
+        if callable(self._previous_sigterm):
+            self._previous_sigterm(signum, frame)
+        else:
+            raise SystemExit(0)
+
     def _run_scheduler(self):
-        """Run the scheduled tasks using simple time checks"""
-        while not self.should_stop:
+        """Run the scheduled tasks, sleeping until the next one is due"""
+        error_wait = self.ERROR_WAIT_MIN
+        while not self._stop_event.is_set():
             try:
                 current_time = datetime.now(self.israel_tz)
                 
-                # Check for daily updates (06:00 Israel time)
-                if self._should_run_daily(current_time):
+                if current_time >= self._next_daily:
                     self._run_daily_updates_job()
-                    self.last_daily_run = current_time.date()
+                    self._next_daily = self._advance(self._next_daily, current_time, timedelta(days=1))
                 
-                # Check for weekly updates (Sunday 05:00 Israel time)
-                if self._should_run_weekly(current_time):
+                if current_time >= self._next_weekly:
                     self._run_weekly_updates_job()
-                    self.last_weekly_run = current_time.date()
+                    self._next_weekly = self._advance(self._next_weekly, current_time, timedelta(days=7))
                 
-                # Check for monthly updates (1st of month 04:00 Israel time)
-                if self._should_run_monthly(current_time):
+                if current_time >= self._next_monthly:
                     self._run_monthly_updates_job()
-                    self.last_monthly_run = current_time.date()
+                    while self._next_monthly <= current_time:
+                        self._next_monthly = self._next_month(self._next_monthly)
                 
-                time.sleep(300)  # Check every 5 minutes
+                error_wait = self.ERROR_WAIT_MIN
+                self._stop_event.wait(self._seconds_until_next_trigger())
             except Exception as e:
+                # Retry quickly after a one-off error, then back off while it
+                # persists - never past a trigger that is still ahead
                 logger.error(f'Scheduler error: {str(e)}')
-                time.sleep(60)
+                until_trigger = self._seconds_until_next_trigger()
+                self._stop_event.wait(min(error_wait, until_trigger) if until_trigger > 0 else error_wait)
+                error_wait = min(error_wait * 2, self.ERROR_WAIT_MAX)
+
+    def _seconds_until_next_trigger(self):
+        """Seconds until the earliest daily/weekly/monthly trigger (0 if due)"""
+        next_trigger = min(self._next_daily, self._next_weekly, self._next_monthly)
+        # timestamp() so the wait is right across a DST change
+        return max(next_trigger.timestamp() - timezone.now().timestamp(), 0)
+
+    def _local_time(self, day, hour):
+        """`hour`:00 Israel time on `day`"""
+        return datetime(day.year, day.month, day.day, hour, tzinfo=self.israel_tz)
+
+    @staticmethod
+    def _advance(trigger, current_time, step):
+        """Next occurrence of `trigger` after `current_time` (skips missed runs)"""
+        while trigger <= current_time:
+            trigger += step
+        return trigger
+
+    def _next_month(self, trigger):
+        """Same time on the 1st of the following month"""
+        first = (trigger.date().replace(day=1) + timedelta(days=32)).replace(day=1)
+        return self._local_time(first, trigger.hour)
 
     def _start_live_monitoring(self):
         """Start continuous live match monitoring"""
         self.stdout.write('🔥 Starting live match monitoring...')
         
         try:
-            call_command('smart_live_scheduler')
+            call_command('smart_live_scheduler', '--quiet-backoff')
         except Exception as e:
             logger.error(f'Live monitoring failed: {str(e)}')
             self.stdout.write(f'❌ Live monitoring error: {str(e)}')
 
+    def _supervise_live_monitoring(self):
+        """Run smart_live_scheduler as a child process and restart it if it dies"""
+        self.stdout.write('🔥 Starting live match monitoring process...')
+        
+        # A separate process keeps the live scheduler's polling loop from
+        # contending for the GIL with the scheduler thread
+        command = [sys.executable, str(settings.BASE_DIR / 'manage.py'), 'smart_live_scheduler', '--quiet-backoff']
+        live_proc = None
+        try:
+            while not self._stop_event.is_set():
+                if live_proc is None or live_proc.poll() is not None:
+                    if live_proc is not None:
+                        logger.error(f'Live monitoring exited with code {live_proc.returncode}, restarting')
+                        self.stdout.write(f'❌ Live monitoring exited ({live_proc.returncode}), restarting...')
+                    live_proc = subprocess.Popen(command)
+                self._stop_event.wait(self.LIVE_SUPERVISE_INTERVAL)
+        finally:
+            if live_proc is not None and live_proc.poll() is None:
+                live_proc.terminate()
+                try:
+                    live_proc.wait(timeout=30)
+                except subprocess.TimeoutExpired:
+                    live_proc.kill()
+
     def _start_live_monitoring_only(self):
         """Start only live monitoring (for testing)"""
         self.stdout.write('🎯 Live monitoring only mode...')
@@ -158,8 +246,7 @@ class Command(BaseCommand):
         try:
             # 1. Update all players (new players, status changes)
             self.stdout.write('👥 Updating all players...')
-            call_command('update_players', '--status', 'pro', '--sex', 'men')
-            call_command('update_players', '--status', 'pro', '--sex', 'women')
+            call_command('update_players', '--status', 'pro', '--sex', 'men', 'women')
             
             # 2. Update all ranking types
             self.stdout.write('🏅 Updating all rankings...')
@@ -223,30 +310,3 @@ class Command(BaseCommand):
             self.stdout.write(f'❌ Live match update test failed: {str(e)}')
         
         self.stdout.write('🎯 Test cycle completed')
-
-    def _should_run_daily(self, current_time):
-        """Check if daily updates should run"""
-        # Run at 06:00 Israel time, once per day
-        if current_time.hour != 6 or current_time.minute > 15:
-            return False
-        
-        today = current_time.date()
-        return self.last_daily_run != today
-    
-    def _should_run_weekly(self, current_time):
-        """Check if weekly updates should run"""
-        # Run on Sunday at 05:00 Israel time, once per week
-        if current_time.weekday() != 6 or current_time.hour != 5 or current_time.minute > 15:
-            return False
-        
-        today = current_time.date()
-        return self.last_weekly_run != today
-    
-    def _should_run_monthly(self, current_time):
-        """Check if monthly updates should run"""
-        # Run on 1st of month at 04:00 Israel time, once per month
-        if current_time.day != 1 or current_time.hour != 4 or current_time.minute > 15:
-            return False
-        
-        today = current_time.date()
-        return self.last_monthly_run != today
\ No newline at end of file
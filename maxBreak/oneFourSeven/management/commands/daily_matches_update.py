@@ -8,10 +8,8 @@ Usage: python manage.py daily_matches_update
 
 from datetime import date, timedelta
 from django.core.management.base import BaseCommand
-from django.core.management import call_command
+from oneFourSeven.management.commands.update_matches import Command as UpdateMatchesCommand
 from oneFourSeven.models import Event
-from oneFourSeven.constants import MIN_REQUEST_INTERVAL
-import time
 
 class Command(BaseCommand):
     help = 'Updates matches for active tournaments - runs daily at 3 AM'
@@ -21,32 +19,44 @@ class Command(BaseCommand):
         
         # Find active tournaments
         today = date.today()
-        active_events = Event.objects.filter(
+        active_events = list(Event.objects.filter(
             StartDate__lte=today + timedelta(days=1),  # Started by tomorrow
             EndDate__gte=today - timedelta(days=1)     # Ended after yesterday
-        ).order_by('StartDate')[:10]  # Limit to 10 to avoid API limits
+        ).order_by('StartDate').only('ID', 'Name')[:10])  # Limit to 10 to avoid API limits
         
-        if not active_events.exists():
+        if not active_events:
             self.stdout.write('❌ No active tournaments found')
             return
         
+        # One update_matches run for every event: a single command bootstrap
+        # and one keep-alive API session, paced by the shared client's rate
+        # limit instead of a fixed sleep per event
+        event_ids = ','.join(str(event.ID) for event in active_events)
+        self.stdout.write(f'🔄 Updating matches for {len(active_events)} tournament(s)')
+        
+        updater = UpdateMatchesCommand(stdout=self.stdout)
+        batch_error = None
+        try:
+            updater.update_events(event_ids=event_ids)
+        except Exception as e:
+            # Rate limiting or an outage stops the batch; events it didn't
+            # reach are reported as failed with that error
+            batch_error = str(e)
+        
         updated_count = 0
         failed_count = 0
         
-        for i, event in enumerate(active_events):
-            self.stdout.write(f'🔄 Updating matches for: {event.Name}')
+        for event in active_events:
+            if event.ID in updater.results:
+                error = updater.results[event.ID]
+            else:
+                error = batch_error or 'Not updated'
             
-            try:
-                call_command('update_matches', '--event-id', event.ID, verbosity=0)
+            if error is None:
                 updated_count += 1
                 self.stdout.write(f'  ✅ Updated {event.Name}')
-                
-                # API rate limiting - wait 6 seconds between requests
-                if i < len(active_events) - 1:
-                    time.sleep(MIN_REQUEST_INTERVAL)  # Respect snooker.org's 2 requests/minute limit
-                    
-            except Exception as e:
+            else:
                 failed_count += 1
-                self.stdout.write(f'  ❌ Failed {event.Name}: {str(e)[:50]}')
+                self.stdout.write(f'  ❌ Failed {event.Name}: {error[:50]}')
         
-        self.stdout.write(f'✅ DAILY MATCHES UPDATE COMPLETE: {updated_count} updated, {failed_count} failed')
\ No newline at end of file
+        self.stdout.write(f'✅ DAILY MATCHES UPDATE COMPLETE: {updated_count} updated, {failed_count} failed')
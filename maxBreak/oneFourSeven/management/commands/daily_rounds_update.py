@@ -9,7 +9,8 @@ Usage: python manage.py daily_rounds_update
 from datetime import date, timedelta
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
-from oneFourSeven.models import Event, RoundDetails
+from django.db.models import Count
+from oneFourSeven.models import Event
 
 class Command(BaseCommand):
     help = 'Updates round details for active tournaments daily'
@@ -19,24 +20,23 @@ class Command(BaseCommand):
         
         # Find active tournaments that need round updates
         today = date.today()
+        # Round counts come from one annotated query rather than a COUNT per event
         active_events = Event.objects.filter(
             StartDate__lte=today,
             EndDate__gte=today + timedelta(days=1)  # Include tomorrow
-        )
+        ).annotate(
+            round_count=Count('round_details')
+        ).filter(round_count__lt=5).only('ID', 'Name')  # Needs round details
         
         updated_count = 0
         
         for event in active_events:
-            # Check if event needs round details
-            existing_rounds = RoundDetails.objects.filter(Event=event).count()
-            
-            if existing_rounds < 5:  # Needs round details
-                self.stdout.write(f'🔄 Updating rounds for: {event.Name}')
-                try:
-                    call_command('update_round_details', '--event-id', event.ID, verbosity=0)
-                    updated_count += 1
-                    self.stdout.write(f'  ✅ Updated {event.Name}')
-                except Exception as e:
-                    self.stdout.write(f'  ❌ Failed {event.Name}: {str(e)[:50]}')
+            self.stdout.write(f'🔄 Updating rounds for: {event.Name}')
+            try:
+                call_command('update_round_details', '--event-id', event.ID, verbosity=0)
+                updated_count += 1
+                self.stdout.write(f'  ✅ Updated {event.Name}')
+            except Exception as e:
+                self.stdout.write(f'  ❌ Failed {event.Name}: {str(e)[:50]}')
         
         self.stdout.write(f'✅ ROUNDS UPDATE COMPLETE: {updated_count} tournaments updated')
\ No newline at end of file
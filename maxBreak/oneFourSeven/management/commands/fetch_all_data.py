@@ -33,8 +33,7 @@ class Command(BaseCommand):
             steps.append(('Tournaments (auto-detected)', 'update_tournaments', {}))
 
         steps += [
-            ('Players (pro men)', 'update_players', {'status': 'pro', 'sex': 'men'}),
-            ('Players (pro women)', 'update_players', {'status': 'pro', 'sex': 'women'}),
+            ('Players (pro men + women)', 'update_players', {'status': 'pro', 'sex': ['men', 'women']}),
             ('Rankings (current season)', 'update_rankings', {'current_season_only': True}),
             ('Recent matches', 'daily_matches_update', {}),
             ('Backfill events with zero match data', 'update_matches', {'empty_only': True}),
@@ -156,15 +156,18 @@ def _link_player(ct_slug, player_name):
     if not parts:
         return None
 
+    # Fetch at most 2 rows to tell "exactly one" from "ambiguous" in one
+    # query, instead of COUNT(*) followed by a separate first()
     for candidate_last in [parts[-1], parts[0]]:
         qs = Player.objects.filter(LastName__iexact=candidate_last)
-        if qs.count() == 1:
-            return qs.first()
-        if qs.count() > 1 and len(parts) >= 2:
+        found = list(qs[:2])
+        if len(found) == 1:
+            return found[0]
+        if len(found) > 1 and len(parts) >= 2:
             candidate_first = parts[0] if candidate_last == parts[-1] else parts[-1]
-            qs2 = qs.filter(FirstName__iexact=candidate_first)
-            if qs2.count() == 1:
-                return qs2.first()
+            found = list(qs.filter(FirstName__iexact=candidate_first)[:2])
+            if len(found) == 1:
+                return found[0]
 
     return None
 
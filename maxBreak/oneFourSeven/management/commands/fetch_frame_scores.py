@@ -15,6 +15,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from oneFourSeven.models import MatchesOfAnEvent, MatchFrameScore, Player, Ranking
 from oneFourSeven.views import get_player_names
@@ -548,21 +549,23 @@ class Command(BaseCommand):
                 f"  Stored ct_slug for {_safe(p2_name)}: {used_p2_slug}"
             )
 
-        # 8. Save frames to DB (delete old rows first)
-        MatchFrameScore.objects.filter(match=match).delete()
-        MatchFrameScore.objects.bulk_create([
-            MatchFrameScore(
-                match=match,
-                frame_number=f["frame"],
-                player1_points=f["p1"],
-                player2_points=f["p2"],
-                player1_break=f["p1_break"],
-                player2_break=f["p2_break"],
-                winner=f["winner"],
-                source="cuetracker",
-            )
-            for f in found_frames
-        ])
+        # 8. Save frames to DB (delete old rows first) - one transaction, so the
+        # bulk DELETE and INSERT commit together and readers never see 0 frames
+        with transaction.atomic():
+            MatchFrameScore.objects.filter(match=match).delete()
+            MatchFrameScore.objects.bulk_create([
+                MatchFrameScore(
+                    match=match,
+                    frame_number=f["frame"],
+                    player1_points=f["p1"],
+                    player2_points=f["p2"],
+                    player1_break=f["p1_break"],
+                    player2_break=f["p2_break"],
+                    winner=f["winner"],
+                    source="cuetracker",
+                )
+                for f in found_frames
+            ])
 
         self.stdout.write(
             f"  OK  {match.api_match_id} ({_safe(p1_name)} vs {_safe(p2_name)} "
@@ -11,6 +11,8 @@ The script identifies and corrects matches where the winner/score data is incons
 
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from django.db.models import CharField, F, Q, Value
+from django.db.models.functions import Coalesce, Concat, Replace, Trim
 from oneFourSeven.models import MatchesOfAnEvent, Player
 import logging
 
@@ -20,6 +22,9 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = 'Fix score display inconsistencies where winner highlighting doesn\'t match displayed scores'
     
+    # Per-match details printed before the rest are summarized in the totals
+    MAX_DETAILS = 50
+    
     def add_arguments(self, parser):
         parser.add_argument(
             '--dry-run',
@@ -37,11 +42,18 @@ class Command(BaseCommand):
             default=1000,
             help='Maximum number of matches to process (default: 1000)',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Match IDs per UPDATE statement when applying fixes (default: 1000)',
+        )
 
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         event_id = options.get('event_id')
         limit = options['limit']
+        batch_size = options.get('batch_size', 1000)
         
         self.stdout.write(
             self.style.SUCCESS(
@@ -49,6 +61,15 @@ class Command(BaseCommand):
             )
         )
         
+        # The score/winner mismatch is tested in SQL, so consistent matches
+        # never leave the database; _analyze_match_consistency only describes
+        # the rows that come back
+        inconsistent_q = (
+            (Q(Score1__gt=F('Score2')) & ~Q(WinnerID=F('Player1ID'))) |
+            (Q(Score2__gt=F('Score1')) & ~Q(WinnerID=F('Player2ID'))) |
+            Q(Score1=F('Score2'))  # WinnerID is non-null for every row here
+        )
+        
         # Build queryset
         queryset = MatchesOfAnEvent.objects.filter(
             Status=3,  # Finished matches only
@@ -59,77 +80,101 @@ class Command(BaseCommand):
             Player2ID__isnull=False,
         ).exclude(
             Score1=0, Score2=0  # Skip matches with no actual scores
-        ).order_by('-Event__Season', 'Event__StartDate')
+        ).filter(inconsistent_q).order_by('-Event__Season', 'Event__StartDate').select_related('Event').only(
+            # Only the columns read below; match.Event.Name is JOINed, not fetched per row
+            'id', 'api_match_id', 'Score1', 'Score2', 'WinnerID',
+            'Player1ID', 'Player2ID', 'Event__Name',
+        )
         
         if event_id:
             queryset = queryset.filter(Event_id=event_id)
             
         queryset = queryset[:limit]
         
-        total_matches = queryset.count()
-        inconsistent_matches = []
-        fixed_count = 0
+        self.stdout.write(f'📊 Checking finished matches for score/winner mismatches (up to {limit})...')
         
-        self.stdout.write(f'📊 Analyzing {total_matches} finished matches...')
+        # Single streaming pass: analyze each row as it arrives and keep only
+        # the IDs to fix, grouped by the column WinnerID should be set from
+        # (None = clear it for a tied score). Names aren't needed to classify,
+        # so they are looked up afterwards for the rows that get printed
+        self._player_names = {}
+        inconsistent_count = 0
+        fix_ids = {'Player1ID': [], 'Player2ID': [], None: []}
+        detail_matches = []
         
-        # Find inconsistent matches
-        for match in queryset:
+        for match in queryset.iterator(chunk_size=500):
             analysis = self._analyze_match_consistency(match)
-            if analysis['is_inconsistent']:
-                inconsistent_matches.append({
-                    'match': match,
-                    'analysis': analysis
-                })
+            if not analysis['is_inconsistent']:
+                continue
+            
+            inconsistent_count += 1
+            if inconsistent_count <= self.MAX_DETAILS:
+                detail_matches.append(match)
+            
+            fix_ids[self._winner_source(analysis)].append(match.id)
         
-        if not inconsistent_matches:
+        if not inconsistent_count:
             self.stdout.write(
                 self.style.SUCCESS('✅ No score inconsistencies found! All matches are correct.')
             )
             return
             
         self.stdout.write(
-            self.style.WARNING(f'🚨 Found {len(inconsistent_matches)} inconsistent matches:')
+            self.style.WARNING(f'🚨 Found {inconsistent_count} inconsistent matches:')
         )
         
-        # Show details of inconsistent matches
-        for item in inconsistent_matches:
-            match = item['match']
-            analysis = item['analysis']
-            
-            self.stdout.write(f'\n🔍 Match ID {match.api_match_id} - {match.Event.Name}:')
-            self.stdout.write(f'   Current: {analysis["player1_name"]} {match.Score1}-{match.Score2} {analysis["player2_name"]}')
-            self.stdout.write(f'   Winner ID: {match.WinnerID} ({analysis["winner_name"]})')
-            self.stdout.write(f'   Issue: {analysis["issue_description"]}')
-            
-            if analysis['suggested_fix']:
-                self.stdout.write(f'   Fix: {analysis["suggested_fix"]}')
+        # Names for every player in the printed matches, in one IN query
+        # (instead of three Player.objects.get() calls per match)
+        player_ids = set()
+        for match in detail_matches:
+            player_ids.update((match.Player1ID, match.Player2ID, match.WinnerID))
+        self._player_names = self._load_player_names(player_ids)
+        
+        for match in detail_matches:
+            self._write_details(match, self._analyze_match_consistency(match))
+        if inconsistent_count > self.MAX_DETAILS:
+            self.stdout.write(f'\n   ... further details omitted (showing first {self.MAX_DETAILS})')
         
         if dry_run:
             self.stdout.write(
-                self.style.WARNING(f'\n🔸 DRY RUN: {len(inconsistent_matches)} matches would be fixed')
+                self.style.WARNING(f'\n🔸 DRY RUN: {inconsistent_count} matches would be fixed')
             )
             return
             
-        # Apply fixes
-        if inconsistent_matches:
-            confirm = input(f'\n⚠️  Fix {len(inconsistent_matches)} inconsistent matches? (y/N): ')
-            if confirm.lower() != 'y':
-                self.stdout.write('❌ Operation cancelled')
-                return
+        # Nothing has been written yet; the UPDATEs only run once confirmed
+        confirm = input(f'\n⚠️  Fix {inconsistent_count} inconsistent matches? (y/N): ')
+        if confirm.lower() != 'y':
+            self.stdout.write('❌ Operation cancelled')
+            return
                 
+        # Every fix in a group sets the same value (a column copy or NULL), so
+        # each batch is one plain UPDATE rather than a per-row CASE bulk_update
+        fixed_count = 0
         with transaction.atomic():
-            for item in inconsistent_matches:
-                match = item['match']
-                analysis = item['analysis']
-                
-                if self._apply_fix(match, analysis):
-                    fixed_count += 1
+            for source, ids in fix_ids.items():
+                value = F(source) if source else None
+                for start in range(0, len(ids), batch_size):
+                    fixed_count += MatchesOfAnEvent.objects.filter(
+                        id__in=ids[start:start + batch_size]
+                    ).update(WinnerID=value)
+                if ids:
+                    logger.info(f"Set WinnerID from {source or 'NULL'} on {len(ids)} matches")
                     
         self.stdout.write(
-            self.style.SUCCESS(f'\n✅ COMPLETED: Fixed {fixed_count}/{len(inconsistent_matches)} matches')
+            self.style.SUCCESS(f'\n✅ COMPLETED: Fixed {fixed_count}/{inconsistent_count} matches')
         )
         self.stdout.write('🔄 Restart your frontend app to see the fixes!')
 
+    def _write_details(self, match, analysis):
+        """Print the issue found for one inconsistent match."""
+        self.stdout.write(f'\n🔍 Match ID {match.api_match_id} - {match.Event.Name}:')
+        self.stdout.write(f'   Current: {analysis["player1_name"]} {match.Score1}-{match.Score2} {analysis["player2_name"]}')
+        self.stdout.write(f'   Winner ID: {match.WinnerID} ({analysis["winner_name"]})')
+        self.stdout.write(f'   Issue: {analysis["issue_description"]}')
+        
+        if analysis['suggested_fix']:
+            self.stdout.write(f'   Fix: {analysis["suggested_fix"]}')
+
     def _analyze_match_consistency(self, match):
         """Analyze a match for score/winner consistency issues."""
         try:
@@ -181,48 +226,34 @@ class Command(BaseCommand):
             logger.error(f"Error analyzing match {match.api_match_id}: {e}")
             return {'is_inconsistent': False, 'error': str(e)}
 
-    def _apply_fix(self, match, analysis):
-        """Apply the fix to a match."""
-        try:
-            if analysis['score_winner_is_player1']:
-                match.WinnerID = match.Player1ID
-                logger.info(f"Fixed match {match.api_match_id}: Set winner to Player1 ({match.Player1ID})")
-                
-            elif analysis['score_winner_is_player2']:
-                match.WinnerID = match.Player2ID  
-                logger.info(f"Fixed match {match.api_match_id}: Set winner to Player2 ({match.Player2ID})")
-                
-            elif match.Score1 == match.Score2:
-                match.WinnerID = None
-                logger.info(f"Fixed match {match.api_match_id}: Cleared winner for tied score")
-                
-            match.save()
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error fixing match {match.api_match_id}: {e}")
-            self.stdout.write(
-                self.style.ERROR(f'❌ Failed to fix match {match.api_match_id}: {e}')
-            )
-            return False
+    def _winner_source(self, analysis):
+        """Column WinnerID should be copied from, or None to clear it."""
+        if analysis['score_winner_is_player1']:
+            return 'Player1ID'
+        if analysis['score_winner_is_player2']:
+            return 'Player2ID'
+        return None
+
+    def _load_player_names(self, player_ids):
+        """Map player ID -> full display name for the given IDs."""
+        # "First Middle Last" is built by the DB; missing parts leave a double
+        # space that Replace/Trim collapse, matching Player.__str__
+        full_name = Trim(Replace(
+            Concat(
+                Coalesce('FirstName', Value('')), Value(' '),
+                Coalesce('MiddleName', Value('')), Value(' '),
+                Coalesce('LastName', Value('')),
+                output_field=CharField(),
+            ),
+            Value('  '), Value(' '),
+        ))
+        rows = Player.objects.filter(ID__in=player_ids).annotate(
+            full_name=full_name
+        ).values_list('ID', 'full_name')
+        return {pid: name or f"Player {pid}" for pid, name in rows}
 
     def _get_player_name(self, player_id):
-        """Get player name with fallback."""
+        """Get player name with fallback (from the names preloaded in handle)."""
         if not player_id:
             return "TBD"
-            
-        try:
-            player = Player.objects.get(ID=player_id)
-            name_parts = []
-            if player.FirstName:
-                name_parts.append(player.FirstName)
-            if player.MiddleName:
-                name_parts.append(player.MiddleName) 
-            if player.LastName:
-                name_parts.append(player.LastName)
-                
-            full_name = " ".join(name_parts)
-            return full_name if full_name else f"Player {player_id}"
-            
-        except Player.DoesNotExist:
-            return f"Player {player_id} (Not Found)"
\ No newline at end of file
+        return self._player_names.get(player_id, f"Player {player_id} (Not Found)")
\ No newline at end of file
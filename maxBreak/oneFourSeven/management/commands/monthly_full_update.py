@@ -9,7 +9,6 @@ Usage: python manage.py monthly_full_update
 from datetime import date
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
-import time
 
 class Command(BaseCommand):
     help = 'Complete database refresh - runs monthly'
@@ -17,24 +16,21 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         self.stdout.write('🌍 MONTHLY FULL UPDATE STARTING...')
         
+        # No pauses between steps: every API request goes through the shared
+        # client, which already keeps snooker.org's rate limit
         try:
             # 1. Update tournaments
             from oneFourSeven.constants import current_season_int
             self.stdout.write('1️⃣ Updating tournaments...')
             call_command('update_tournaments', '--season', str(current_season_int()), verbosity=0)
-            time.sleep(10)
             
             # 2. Update players
             self.stdout.write('2️⃣ Updating players...')
-            call_command('update_players', '--status', 'pro', '--sex', 'men', verbosity=0)
-            time.sleep(10)
-            call_command('update_players', '--status', 'pro', '--sex', 'women', verbosity=0)
-            time.sleep(10)
+            call_command('update_players', '--status', 'pro', '--sex', 'men', 'women', verbosity=0)
             
             # 3. Update rankings
             self.stdout.write('3️⃣ Updating rankings...')
             call_command('update_rankings', '--current-season-only', verbosity=0)
-            time.sleep(10)
             
             # 4. Update recent tournament matches
             self.stdout.write('4️⃣ Updating recent tournament matches...')
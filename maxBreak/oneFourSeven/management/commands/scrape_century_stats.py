@@ -144,16 +144,18 @@ def scrape_and_save(url: str = SNOOKERINFO_URL, stdout=None) -> int:
             if parts:
                 # Try last word as LastName first (Western convention)
                 for candidate_last in [parts[-1], parts[0]]:
+                    # At most 2 rows tells "unique" from "ambiguous" in one query
                     qs = Player.objects.filter(LastName__iexact=candidate_last)
-                    if qs.count() == 1:
-                        linked = qs.first()
+                    found = list(qs[:2])
+                    if len(found) == 1:
+                        linked = found[0]
                         break
-                    elif qs.count() > 1 and len(parts) >= 2:
+                    elif len(found) > 1 and len(parts) >= 2:
                         # Try matching first word as FirstName
                         candidate_first = parts[0] if candidate_last == parts[-1] else parts[-1]
-                        qs2 = qs.filter(FirstName__iexact=candidate_first)
-                        if qs2.count() == 1:
-                            linked = qs2.first()
+                        found = list(qs.filter(FirstName__iexact=candidate_first)[:2])
+                        if len(found) == 1:
+                            linked = found[0]
                             break
                     if linked:
                         break
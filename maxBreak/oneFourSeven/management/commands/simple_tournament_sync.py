@@ -22,10 +22,11 @@ import logging
 from datetime import datetime, timedelta
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
+from django.db.models import Count
 from django.utils import timezone
 from oneFourSeven.models import Event, MatchesOfAnEvent, Player
+from oneFourSeven.management.commands.update_matches import run_update_matches
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class Command(BaseCommand):
@@ -51,13 +52,15 @@ class Command(BaseCommand):
             
             self.stdout.write(f'[RANGE] Checking tournaments from {start_range} to {end_range}')
             
-            # Get all tournaments in this range
-            tournaments = Event.objects.filter(
+            # Get all tournaments in this range (materialized once: counted
+            # twice and iterated below), with their match counts from one
+            # GROUP BY instead of a COUNT per tournament
+            tournaments = list(Event.objects.filter(
                 StartDate__gte=start_range,
                 StartDate__lte=end_range
-            ).order_by('StartDate')
+            ).annotate(match_count=Count('matches')).order_by('StartDate'))
             
-            self.stdout.write(f'[FOUND] Found {tournaments.count()} tournaments to check')
+            self.stdout.write(f'[FOUND] Found {len(tournaments)} tournaments to check')
             
             tournaments_updated = []
             players_updated = set()
@@ -67,7 +70,7 @@ class Command(BaseCommand):
                 self.stdout.write(f'[CHECK] {tournament.Name} (ID: {tournament.ID}) - {tournament.StartDate}')
                 
                 # Count existing matches
-                match_count = MatchesOfAnEvent.objects.filter(Event=tournament).count()
+                match_count = tournament.match_count
                 self.stdout.write(f'[MATCHES] {tournament.Name} has {match_count} matches')
                 
                 # If no matches OR force update, try to get them
@@ -93,7 +96,7 @@ class Command(BaseCommand):
             
             # Summary
             self.stdout.write(f'[SUMMARY] Tournament sync completed:')
-            self.stdout.write(f'  - Tournaments checked: {tournaments.count()}')
+            self.stdout.write(f'  - Tournaments checked: {len(tournaments)}')
             self.stdout.write(f'  - Tournaments updated: {len(tournaments_updated)}')
             self.stdout.write(f'  - Player categories updated: {len(players_updated)}')
             
@@ -113,7 +116,7 @@ class Command(BaseCommand):
             self.stdout.write(f'[UPDATE] Updating matches for {tournament.Name}...')
             
             # Try to update matches
-            call_command('update_matches', '--event-id', str(tournament.ID))
+            run_update_matches(event_id=tournament.ID, stdout=self.stdout)
             
             # Check if it worked
             new_match_count = MatchesOfAnEvent.objects.filter(Event=tournament).count()
@@ -129,7 +132,8 @@ class Command(BaseCommand):
         """Update live matches for active tournament."""
         try:
             self.stdout.write(f'[LIVE] Updating live matches for {tournament.Name}...')
-            call_command('update_live_matches', '--event-id', str(tournament.ID))
+            # update_live_matches has no --event-id; refresh just this event
+            run_update_matches(event_id=tournament.ID, stdout=self.stdout)
             self.stdout.write(f'[SUCCESS] Updated live matches for {tournament.Name}')
         except Exception as e:
             self.stdout.write(f'[INFO] Could not update live matches for {tournament.Name}: {str(e)}')
@@ -16,31 +16,39 @@ HOW IT WORKS:
 5. Error recovery and retry logic
 6. Timezone-aware scheduling
 
-USAGE: python manage.py smart_live_scheduler
+USAGE: python manage.py smart_live_scheduler [--check-interval N] [--quiet-backoff]
 """
 
+import signal
 import time
 import threading
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from django.core.management.base import BaseCommand
-from django.core.management import call_command
+from django.db.models import Count, Min
 from django.utils import timezone
-from oneFourSeven.models import Event, MatchesOfAnEvent
-import pytz
+from oneFourSeven.active_events import get_active_events
+from oneFourSeven.models import MatchesOfAnEvent
+from oneFourSeven.management.commands.update_matches import run_update_matches
 import logging
 
 # Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+ISRAEL_TZ = ZoneInfo('Asia/Jerusalem')
+
 class Command(BaseCommand):
     help = 'Smart live match scheduler with continuous monitoring'
 
+    # Longest quiet-period sleep, so schedule changes made by other jobs are
+    # still picked up within a few hours
+    MAX_QUIET_SLEEP = 3 * 3600
+
     def __init__(self):
         super().__init__()
-        self.should_stop = False
-        self.monitoring_thread = None
-        self.israel_tz = pytz.timezone('Asia/Jerusalem')
+        # Set by SIGTERM/SIGINT; the inter-check wait returns as soon as it is
+        self._stop_event = threading.Event()
+        self.israel_tz = ISRAEL_TZ
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -52,25 +60,42 @@ class Command(BaseCommand):
             '--check-interval',
             type=int,
             default=120,  # 2 minutes
-            help='Check interval in seconds during quiet periods'
+            help='Longest wait in seconds between checks during quiet periods '
+                 '(unless --quiet-backoff is given)'
+        )
+        parser.add_argument(
+            '--quiet-backoff',
+            action='store_true',
+            help='During quiet periods, sleep until shortly before the next '
+                 f'scheduled match (up to {self.MAX_QUIET_SLEEP // 3600} hours), '
+                 'even if that is longer than --check-interval'
         )
 
     def handle(self, *args, **options):
         run_once = options.get('run_once', False)
         check_interval = options.get('check_interval', 120)
+        quiet_backoff = options.get('quiet_backoff', False)
 
         if run_once:
             self._run_single_check()
         else:
-            self._start_continuous_monitoring(check_interval)
+            self._start_continuous_monitoring(check_interval, quiet_backoff)
 
-    def _start_continuous_monitoring(self, check_interval):
+    def _start_continuous_monitoring(self, check_interval, quiet_backoff=False):
         """Start continuous monitoring with intelligent scheduling"""
         self.stdout.write('🚀 SMART LIVE SCHEDULER STARTING...')
         self.stdout.write(f'⏱️ Base check interval: {check_interval} seconds')
         
+        # Signal handlers can only be installed from the main thread
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, lambda *_: self._stop_event.set())
+        
         try:
-            while not self.should_stop:
+            while not self._stop_event.is_set():
+                # Each check is timed from its own start, so the cadence holds
+                # no matter how long the check itself takes
+                tick_start = time.monotonic()
                 current_time = datetime.now(self.israel_tz)
                 self.stdout.write(f'🔍 Monitoring check at {current_time.strftime("%Y-%m-%d %H:%M:%S")}')
                 
@@ -82,52 +107,64 @@ class Command(BaseCommand):
                     interval = 120  # 2 minutes during active periods
                     self.stdout.write('🔥 ACTIVE PERIOD - Checking every 2 minutes')
                 else:
-                    interval = min(check_interval, 900)  # Max 15 minutes during quiet periods
-                    self.stdout.write(f'😴 Quiet period - Checking every {interval//60} minutes')
+                    interval = self._compute_next_sleep(current_time, check_interval, quiet_backoff)
+                    self.stdout.write(f'😴 Quiet period - Next check in {int(interval)//60} minutes')
                 
                 # Run the monitoring check
                 self._run_monitoring_check(current_time)
                 
-                # Wait for the next check
-                time.sleep(interval)
-                
-        except KeyboardInterrupt:
+                # Wait out the rest of the interval (none if the check overran)
+                if self._stop_event.wait(max(tick_start + interval - time.monotonic(), 0)):
+                    break
+            
             self.stdout.write('⏹️ Stopping smart scheduler...')
         except Exception as e:
             logger.error(f'Smart scheduler error: {str(e)}')
             self.stdout.write(f'❌ Error: {str(e)}')
 
+    def _compute_next_sleep(self, current_time, check_interval, quiet_backoff=False):
+        """
+        Quiet-period sleep that tightens as the next scheduled match approaches.
+        Capped at check_interval unless quiet_backoff was asked for.
+        """
+        next_start = MatchesOfAnEvent.objects.filter(
+            Status=0, ScheduledDate__gt=current_time
+        ).aggregate(next_start=Min('ScheduledDate'))['next_start']
+        
+        if next_start is None:
+            return min(check_interval, 900)  # Nothing scheduled - old 15-minute cap
+        
+        eta = (next_start - current_time).total_seconds()
+        if eta > 3600:
+            # Wake 5 minutes before the match
+            sleep = min(eta - 300, self.MAX_QUIET_SLEEP)
+        elif eta > 600:
+            sleep = eta / 4
+        else:
+            sleep = 120  # Imminent - same cadence as an active period
+        return sleep if quiet_backoff else min(sleep, check_interval)
+
     def _is_active_period(self, current_time):
         """Determine if we're in an active tournament period"""
-        # Check if any tournaments are active
-        today = current_time.date()
-        tomorrow = today + timedelta(days=1)
+        # Active tournaments (started by tomorrow and not finished) - cached,
+        # the set only changes when tournaments are re-synced
+        active_ids = [event.ID for event in get_active_events(current_time.date())]
         
-        # Active tournaments (started and not finished)
-        active_events = Event.objects.filter(
-            StartDate__lte=tomorrow,
-            EndDate__gte=today
-        )
-        
-        if not active_events.exists():
+        if not active_ids:
             return False
         
-        # Check if any matches are scheduled soon or currently running
-        for event in active_events:
-            # Look for matches in the next 2 hours or currently running
-            upcoming_matches = MatchesOfAnEvent.objects.filter(
-                Event=event,
-                Status__in=[0, 1, 2],  # Scheduled, Running, or On Break
-                ScheduledDate__gte=current_time - timedelta(hours=1),
-                ScheduledDate__lte=current_time + timedelta(hours=2)
-            )
-            
-            if upcoming_matches.exists():
-                return True
+        # Typical playing hours (12:00 - 23:00) are active whatever the
+        # schedule says, so the match query only runs outside them
+        if 12 <= current_time.hour <= 23:
+            return True
         
-        # Check time of day - more active during typical playing hours (12:00 - 23:00)
-        current_hour = current_time.hour
-        return 12 <= current_hour <= 23
+        # Any match across them scheduled soon or currently running
+        return MatchesOfAnEvent.objects.filter(
+            Event_id__in=active_ids,
+            Status__in=MatchesOfAnEvent.LIVE_ELIGIBLE_STATUSES,  # Scheduled, Running, or On Break
+            ScheduledDate__gte=current_time - timedelta(hours=1),
+            ScheduledDate__lte=current_time + timedelta(hours=2)
+        ).exists()
 
     def _run_monitoring_check(self, current_time):
         """Run a single monitoring check"""
@@ -136,11 +173,13 @@ class Command(BaseCommand):
             live_events = self._detect_live_tournaments(current_time)
             
             # 2. Update live matches for active tournaments
+            updated_ids = set()
             if live_events:
-                self._update_live_tournaments(live_events)
+                updated_ids = self._update_live_tournaments(live_events)
             
             # 3. Clean up finished matches that are still marked as running
-            self._cleanup_finished_matches(current_time)
+            # (events refreshed in step 2 already have fresh data)
+            self._cleanup_finished_matches(current_time, skip_event_ids=updated_ids)
             
         except Exception as e:
             logger.error(f'Monitoring check failed: {str(e)}')
@@ -149,81 +188,51 @@ class Command(BaseCommand):
     def _detect_live_tournaments(self, current_time):
         """Detect tournaments that should have live matches"""
         today = current_time.date()
-        live_events = []
         
-        # Get tournaments that are currently active
-        active_events = Event.objects.filter(
-            StartDate__lte=today,
-            EndDate__gte=today
-        )
+        # Tournaments that are currently active (cached list; it also holds
+        # events starting tomorrow)
+        active_events = [event for event in get_active_events(today) if event.StartDate <= today]
+        if not active_events:
+            return []
         
-        for event in active_events:
-            # Check if this tournament has matches that should be live
-            should_be_live = self._tournament_should_be_live(event, current_time)
-            
-            if should_be_live:
-                live_events.append(event)
-                self.stdout.write(f'🎯 {event.Name} should have live matches')
+        # One query returns the IDs of the active events that have a match
+        # in the live window
+        live_ids = set(MatchesOfAnEvent.objects.filter(
+            Event_id__in=[event.ID for event in active_events],
+        ).live_window(current_time).order_by().values_list('Event_id', flat=True).distinct())
         
-        return live_events
-
-    def _tournament_should_be_live(self, event, current_time):
-        """Check if a tournament should have live matches right now"""
-        # Get today's matches for this event
-        today = current_time.date()
-        today_matches = MatchesOfAnEvent.objects.filter(
-            Event=event,
-            ScheduledDate__date=today,
-            Status__in=[0, 1, 2]  # Scheduled, Running, or On Break
-        )
-        
-        for match in today_matches:
-            if self._should_match_be_live(match, current_time):
-                return True
+        live_events = [event for event in active_events if event.ID in live_ids]
+        for event in live_events:
+            self.stdout.write(f'🎯 {event.Name} should have live matches')
         
-        return False
-
-    def _should_match_be_live(self, match, current_time):
-        """Check if a specific match should be live"""
-        if not match.ScheduledDate:
-            return False
-        
-        # Convert scheduled time to Israel timezone
-        if match.ScheduledDate.tzinfo is None:
-            match_time = self.israel_tz.localize(match.ScheduledDate)
-        else:
-            match_time = match.ScheduledDate.astimezone(self.israel_tz)
-        
-        # Match should be live if:
-        # 1. Current time is at or after scheduled time
-        # 2. Not more than 4 hours after scheduled time
-        time_diff = current_time - match_time
-        
-        # Allow matches to start up to 15 minutes early (sometimes they start early)
-        early_start = timedelta(minutes=-15)
-        max_duration = timedelta(hours=4)
-        
-        return early_start <= time_diff <= max_duration
+        return live_events
 
     def _update_live_tournaments(self, events):
-        """Update live match data for the given tournaments"""
+        """Update live match data for the given tournaments; returns the IDs updated"""
         self.stdout.write(f'🔄 Updating {len(events)} tournaments...')
+        updated_ids = set()
         
+        # No delay between events: the shared API client already spaces
+        # request starts MIN_REQUEST_INTERVAL apart, so the next event's wait
+        # overlaps this one's download and save
         for event in events:
             try:
                 # Update matches for this specific event
-                call_command('update_matches', '--event-id', str(event.ID))
+                run_update_matches(event_id=event.ID, stdout=self.stdout)
+                updated_ids.add(event.ID)
                 self.stdout.write(f'  ✅ Updated {event.Name}')
                 
-                # Small delay between updates to be nice to the API
-                time.sleep(2)
-                
             except Exception as e:
                 logger.error(f'Failed to update {event.Name}: {str(e)}')
                 self.stdout.write(f'  ❌ Failed {event.Name}: {str(e)}')
+        
+        return updated_ids
 
-    def _cleanup_finished_matches(self, current_time):
-        """Clean up matches that should be finished but are still marked as running"""
+    def _cleanup_finished_matches(self, current_time, skip_event_ids=()):
+        """
+        Clean up matches that should be finished but are still marked as running.
+        Events in ``skip_event_ids`` were already refreshed this tick.
+        """
         # Find matches that have been "running" for more than 4 hours
         cutoff_time = current_time - timedelta(hours=4)
         
@@ -232,16 +241,23 @@ class Command(BaseCommand):
             ScheduledDate__lt=cutoff_time
         )
         
-        if stuck_matches.exists():
-            self.stdout.write(f'🧹 Found {stuck_matches.count()} potentially stuck matches')
+        # One GROUP BY gives the stuck-match count per event: several stuck
+        # matches in one event only need that event refreshed once
+        stuck_by_event = list(
+            stuck_matches.order_by('Event_id').values('Event_id', 'Event__Name').annotate(stuck=Count('id'))
+        )
+        
+        if stuck_by_event:
+            stuck_count = sum(row['stuck'] for row in stuck_by_event)
+            self.stdout.write(f'🧹 Found {stuck_count} potentially stuck matches in {len(stuck_by_event)} tournaments')
             
-            for match in stuck_matches[:5]:  # Limit to 5 at a time
-                # Try to update this specific match
+            to_refresh = [row for row in stuck_by_event if row['Event_id'] not in skip_event_ids]
+            for row in to_refresh[:5]:  # Limit to 5 events at a time
+                # Refresh the event the stuck matches belong to (the shared API
+                # client spaces these requests, no extra sleep needed)
                 try:
-                    event = match.Event
-                    call_command('update_matches', '--event-id', str(event.ID))
-                    self.stdout.write(f'  🔄 Refreshed stuck match in {event.Name}')
-                    time.sleep(1)
+                    run_update_matches(event_id=row['Event_id'], stdout=self.stdout)
+                    self.stdout.write(f'  🔄 Refreshed {row["stuck"]} stuck match(es) in {row["Event__Name"]}')
                 except Exception as e:
                     logger.error(f'Failed to refresh stuck match: {str(e)}')
 
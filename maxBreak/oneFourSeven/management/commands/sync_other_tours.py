@@ -268,11 +268,10 @@ class Command(BaseCommand):
                 resync_count = 0
                 for ev in stale_events:
                     # Consider stale if all matches are Status=0 and score is 0-0
-                    all_matches = OtherTourMatch.objects.filter(event=ev)
-                    if not all_matches.exists():
-                        has_stale = True
-                    else:
-                        has_stale = all_matches.filter(status=0, score1=0, score2=0).count() == all_matches.count()
+                    # (or there are none): i.e. no non-stale match EXISTS
+                    has_stale = not OtherTourMatch.objects.filter(event=ev).exclude(
+                        status=0, score1=0, score2=0
+                    ).exists()
                     if not has_stale:
                         continue
                     self.stdout.write(f'  [RESYNC] Re-fetching matches for: {ev.name} (id={ev.snooker_id})')
@@ -5,11 +5,23 @@ Quick command to test if the live match detection is working properly.
 This will show you exactly what matches should be live right now.
 """
 
+from collections import defaultdict
 from datetime import datetime, timedelta
 from django.core.management.base import BaseCommand
+from django.db.models import Count, Q
 from django.utils import timezone
 from oneFourSeven.models import Event, MatchesOfAnEvent
 
+STATUS_NAMES = {
+    0: 'Scheduled',
+    1: 'Running',
+    2: 'On Break',
+    3: 'Finished',
+}
+# Statuses a match that should be live is expected to have
+LIVE_STATUSES = frozenset((1, 2))  # Running or on break
+
+
 class Command(BaseCommand):
     help = 'Test live match detection system'
 
@@ -19,72 +31,85 @@ class Command(BaseCommand):
         # Use UTC time for now (we'll handle timezone later)
         now = timezone.now()
         today = now.date()
+        # Half-open [midnight, next midnight) range instead of ScheduledDate__date,
+        # so the (Event, ScheduledDate, Status) index can be range-scanned
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        day_end = day_start + timedelta(days=1)
         
         self.stdout.write(f'📅 Current time: {now.strftime("%Y-%m-%d %H:%M:%S UTC")}')
         
         # Find active tournaments
-        active_events = Event.objects.filter(
+        active_events = list(Event.objects.filter(
             StartDate__lte=today,
             EndDate__gte=today
-        )
+        ).only('ID', 'Name', 'StartDate', 'EndDate'))
+        event_ids = [event.ID for event in active_events]
+        
+        self.stdout.write(f'\n🏟️ Found {len(active_events)} active tournaments:')
         
-        self.stdout.write(f'\n🏟️ Found {active_events.count()} active tournaments:')
+        # Should be live: scheduled between 4 hours ago and 15 minutes from now.
+        # The window is classified in SQL: one GROUP BY counts today's, live
+        # and upcoming matches for every event, and only the live rows (which
+        # are all printed) are fetched.
+        todays = MatchesOfAnEvent.objects.filter(
+            Event__in=event_ids,
+            ScheduledDate__gte=day_start,
+            ScheduledDate__lt=day_end
+        )
+        live_q = Q(ScheduledDate__gte=now - timedelta(hours=4), ScheduledDate__lte=now + timedelta(minutes=15))
+        upcoming_q = Q(ScheduledDate__gt=now + timedelta(minutes=15))
+        counts = {
+            row['Event']: row
+            for row in todays.order_by().values('Event').annotate(
+                today=Count('pk'),
+                live=Count('pk', filter=live_q),
+                upcoming=Count('pk', filter=upcoming_q),
+            )
+        }
+        live_by_event = defaultdict(list)
+        for match in todays.filter(live_q).order_by('ScheduledDate').only(
+            'Event', 'api_match_id', 'ScheduledDate', 'Status'
+        ):
+            live_by_event[match.Event_id].append(match)
         
         total_live_matches = 0
         
         for event in active_events:
-            self.stdout.write(f'\n📋 {event.Name} (ID: {event.ID})')
-            self.stdout.write(f'   Dates: {event.StartDate} to {event.EndDate}')
-            
-            # Get today's matches
-            today_matches = MatchesOfAnEvent.objects.filter(
-                Event=event,
-                ScheduledDate__date=today
-            )
-            
-            self.stdout.write(f'   📊 {today_matches.count()} matches scheduled for today')
+            # Each event's report goes out in one write
+            lines = []
+            lines.append(f'\n📋 {event.Name} (ID: {event.ID})')
+            lines.append(f'   Dates: {event.StartDate} to {event.EndDate}')
             
-            live_matches = []
-            upcoming_matches = []
-            
-            for match in today_matches:
-                if not match.ScheduledDate:
-                    continue
-                
-                # Use the scheduled time as-is for now
-                match_time = match.ScheduledDate
-                if match_time.tzinfo is None:
-                    match_time = timezone.make_aware(match_time)
-                
-                time_diff = now - match_time
-                
-                # Check if should be live (between -15 minutes and +4 hours)
-                if timedelta(minutes=-15) <= time_diff <= timedelta(hours=4):
-                    live_matches.append((match, match_time, time_diff))
-                elif time_diff < timedelta(minutes=-15):
-                    upcoming_matches.append((match, match_time, time_diff))
+            event_counts = counts.get(event.ID, {'today': 0, 'live': 0, 'upcoming': 0})
+            lines.append(f'   📊 {event_counts["today"]} matches scheduled for today')
             
+            live_matches = live_by_event[event.ID]
             if live_matches:
-                self.stdout.write(f'   🔥 {len(live_matches)} SHOULD BE LIVE:')
-                for match, match_time, time_diff in live_matches:
+                lines.append(f'   🔥 {len(live_matches)} SHOULD BE LIVE:')
+                for match in live_matches:
                     status_name = self._get_status_name(match.Status)
-                    minutes_diff = int(time_diff.total_seconds() / 60)
-                    self.stdout.write(f'      🎯 {match.api_match_id}: {match_time.strftime("%H:%M")} ({minutes_diff:+d}min) - Status: {status_name}')
+                    minutes_diff = int((now - match.ScheduledDate).total_seconds() / 60)
+                    lines.append(f'      🎯 {match.api_match_id}: {match.ScheduledDate.strftime("%H:%M")} ({minutes_diff:+d}min) - Status: {status_name}')
                     
-                    if match.Status not in [1, 2]:  # Not running or on break
-                        self.stdout.write(f'         ⚠️  PROBLEM: Should be live but status is {status_name}')
+                    if match.Status not in LIVE_STATUSES:
+                        lines.append(f'         ⚠️  PROBLEM: Should be live but status is {status_name}')
                 
                 total_live_matches += len(live_matches)
             
-            if upcoming_matches:
-                self.stdout.write(f'   ⏰ {len(upcoming_matches)} upcoming matches:')
-                for match, match_time, time_diff in upcoming_matches[:3]:  # Show first 3
-                    minutes_until = int(abs(time_diff.total_seconds()) / 60)
-                    self.stdout.write(f'      📅 {match.api_match_id}: {match_time.strftime("%H:%M")} (in {minutes_until}min)')
+            if event_counts['upcoming']:
+                lines.append(f'   ⏰ {event_counts["upcoming"]} upcoming matches:')
+                # Show the next 3
+                for match in todays.filter(upcoming_q, Event=event.ID).order_by('ScheduledDate').only(
+                    'api_match_id', 'ScheduledDate'
+                )[:3]:
+                    minutes_until = int((match.ScheduledDate - now).total_seconds() / 60)
+                    lines.append(f'      📅 {match.api_match_id}: {match.ScheduledDate.strftime("%H:%M")} (in {minutes_until}min)')
+            
+            self.stdout.write('\n'.join(lines))
         
         # Summary
         self.stdout.write(f'\n📈 SUMMARY:')
-        self.stdout.write(f'   🏟️ Active tournaments: {active_events.count()}')
+        self.stdout.write(f'   🏟️ Active tournaments: {len(active_events)}')
         self.stdout.write(f'   🔥 Matches that should be live: {total_live_matches}')
         
         if total_live_matches > 0:
@@ -94,10 +119,4 @@ class Command(BaseCommand):
     
     def _get_status_name(self, status_code):
         """Get human-readable status name"""
-        status_names = {
-            0: 'Scheduled',
-            1: 'Running',
-            2: 'On Break', 
-            3: 'Finished'
-        }
-        return status_names.get(status_code, f'Unknown({status_code})')
\ No newline at end of file
+        return STATUS_NAMES.get(status_code, f'Unknown({status_code})')
\ No newline at end of file
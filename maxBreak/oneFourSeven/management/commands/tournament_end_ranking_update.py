@@ -8,8 +8,11 @@ Usage: python manage.py tournament_end_ranking_update
 
 from datetime import date, timedelta
 from django.core.management.base import BaseCommand
-from django.core.management import call_command
-from oneFourSeven.models import Event, MatchesOfAnEvent
+from django.db.models import Count, F, Q
+from django.db.models.lookups import GreaterThan
+from oneFourSeven.models import Event
+from oneFourSeven.management.commands.update_players import run_update_players
+from oneFourSeven.management.commands.update_rankings import run_update_rankings
 
 class Command(BaseCommand):
     help = 'Updates rankings when tournaments finish'
@@ -17,38 +20,34 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         self.stdout.write('🏆 TOURNAMENT END RANKING UPDATE STARTING...')
         
-        # Find tournaments that just finished (ended in last 3 days)
+        # Find tournaments that just finished (ended in last 3 days) where
+        # most matches are finished: finished / total > 0.8, checked in SQL
+        # as finished * 5 > total * 4 (HAVING on the GROUP BY, and false
+        # for an event with no matches)
         today = date.today()
-        recent_finished = Event.objects.filter(
+        recent_finished = list(Event.objects.filter(
             EndDate__gte=today - timedelta(days=3),
             EndDate__lt=today
-        )
-        
-        ranking_updates_needed = 0
+        ).annotate(
+            total_matches=Count('matches'),
+            final_matches=Count('matches', filter=Q(matches__Status=2)),  # Finished
+        ).filter(
+            GreaterThan(F('final_matches') * 5, F('total_matches') * 4)
+        ).only('ID', 'Name'))
         
         for event in recent_finished:
-            # Check if final match is finished
-            final_matches = MatchesOfAnEvent.objects.filter(
-                Event=event,
-                Status=2  # Finished
-            ).count()
-            
-            total_matches = MatchesOfAnEvent.objects.filter(Event=event).count()
-            
-            # If most matches are finished, tournament is done
-            if total_matches > 0 and final_matches / total_matches > 0.8:
-                self.stdout.write(f'🎯 Tournament finished: {event.Name}')
-                ranking_updates_needed += 1
+            self.stdout.write(f'🎯 Tournament finished: {event.Name}')
+        ranking_updates_needed = len(recent_finished)
         
         # Update rankings if tournaments finished
         if ranking_updates_needed > 0:
             self.stdout.write(f'🔄 Updating rankings for {ranking_updates_needed} finished tournaments...')
             try:
-                call_command('update_rankings', '--current-season-only', verbosity=0)
+                run_update_rankings(current_season_only=True, stdout=self.stdout)
                 self.stdout.write('✅ Rankings updated successfully')
                 
                 # Also update players
-                call_command('update_players', '--status', 'pro', '--sex', 'men', verbosity=0) 
+                run_update_players(status='pro', sex=['men'], stdout=self.stdout)
                 self.stdout.write('✅ Players updated successfully')
                 
             except Exception as e:
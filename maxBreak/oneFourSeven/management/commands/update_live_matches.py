@@ -6,11 +6,10 @@ Usage: python manage.py update_live_matches
 """
 
 import logging
-import time
 from datetime import date, timedelta
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Case, Count, F, Q, When
 from django.utils import timezone as dj_timezone
 
 from oneFourSeven.scraper import (
@@ -19,11 +18,19 @@ from oneFourSeven.scraper import (
 )
 from oneFourSeven.models import Event, MatchesOfAnEvent
 from oneFourSeven.data_savers import DatabaseSaver
-from oneFourSeven.constants import MIN_REQUEST_INTERVAL
 
 logger = logging.getLogger(__name__)
 
 
+def run_live_matches(max_events=8, dry_run=False, stdout=None):
+    """
+    In-process entry point for long-running callers (auto_live_monitor).
+    Skips call_command's command lookup and argparse on every poll; output
+    goes to ``stdout`` (defaults to sys.stdout like a normal command).
+    """
+    Command(stdout=stdout).update_live_matches(max_events=max_events, dry_run=dry_run)
+
+
 class Command(BaseCommand):
     help = 'Update live matches for active tournaments (respects 10 requests/minute limit)'
 
@@ -41,13 +48,17 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
+        self.update_live_matches(
+            max_events=options.get('max_events', 8),
+            dry_run=options.get('dry_run', False),
+        )
+
+    def update_live_matches(self, max_events=8, dry_run=False):
+        """Fetch and save matches for active tournaments (the body of the command)."""
         self.stdout.write(
             self.style.SUCCESS('Starting live matches update...')
         )
 
-        max_events = options.get('max_events', 8)
-        dry_run = options.get('dry_run', False)
-
         try:
             # Find active tournaments (running now or very recently)
             today = date.today()
@@ -66,28 +77,27 @@ class Command(BaseCommand):
             # (unfinished status, scheduled time already passed) ahead of ones
             # with nothing urgent.
             now = dj_timezone.now()
-            active_events = Event.objects.filter(
+            active_events = list(Event.objects.filter(
                 StartDate__lte=tomorrow,  # Started by tomorrow
                 EndDate__gte=yesterday,   # Ended after yesterday
             ).annotate(
                 due_now=Count(
                     'matches',
-                    filter=Q(matches__Status__in=[0, 1, 2], matches__ScheduledDate__lte=now),
+                    filter=Q(matches__Status__in=MatchesOfAnEvent.LIVE_ELIGIBLE_STATUSES, matches__ScheduledDate__lte=now),
                 )
-            ).order_by('-due_now', 'StartDate')
-
-            active_event_ids = set(active_events.values_list('ID', flat=True))
+            ).order_by('-due_now', 'StartDate').only('ID', 'Name'))
 
             # Also include past events (up to 60 days) that still have unfinished matches
             # e.g. qualifiers whose EndDate passed but matches are still running
-            past_with_unfinished = Event.objects.filter(
-                EndDate__lt=yesterday,
-                EndDate__gte=today - timedelta(days=60),
-                matches__Status__in=[0, 1, 2],
-            ).distinct().exclude(ID__in=active_event_ids)
-
-            all_events = list(active_events) + list(past_with_unfinished)
-            all_events = all_events[:max_events]
+            # (only queried when the active events leave room under max_events)
+            all_events = active_events[:max_events]
+            if len(all_events) < max_events:
+                past_with_unfinished = Event.objects.filter(
+                    EndDate__lt=yesterday,
+                    EndDate__gte=today - timedelta(days=60),
+                    matches__Status__in=MatchesOfAnEvent.LIVE_ELIGIBLE_STATUSES,
+                ).distinct().exclude(ID__in=[event.ID for event in active_events]).only('ID', 'Name')
+                all_events += list(past_with_unfinished[:max_events - len(all_events)])
 
             event_count = len(all_events)
 
@@ -107,18 +117,16 @@ class Command(BaseCommand):
                 )
                 return
 
-            # Update matches with rate limiting
+            # Update matches. No sleep between events: the shared API client
+            # starts each request MIN_REQUEST_INTERVAL after the previous one
+            # started, so the next event's wait overlaps this one's save.
             updated_count = 0
             failed_count = 0
 
-            for i, event in enumerate(all_events):
+            for event in all_events:
                 self.stdout.write(f'Updating matches for: {event.Name}')
                 
                 try:
-                    # Rate limiting: 6 seconds between requests (10 per minute)
-                    if i > 0:
-                        time.sleep(MIN_REQUEST_INTERVAL)  # Respect snooker.org's 2 requests/minute limit
-                    
                     self.stdout.write(f'  Fetching matches data...', ending='')
                     
                     # Fetch latest matches with better error reporting
@@ -178,7 +186,7 @@ class Command(BaseCommand):
     def _save_missing_players(self, events):
         """Fetch and save any player IDs from these events that aren't in our DB yet."""
         from oneFourSeven.models import Player
-        import requests
+        from oneFourSeven.api_client import api_client, fetch_player_profile_data
 
         # Collect all player IDs referenced in these events' matches
         match_player_ids = set(
@@ -199,19 +207,12 @@ class Command(BaseCommand):
 
         for pid in missing_ids:
             try:
-                time.sleep(30)  # Respect 2 req/min limit
-                resp = requests.get(
-                    f'https://api.snooker.org/?t=4&p={pid}',
-                    headers={'X-Requested-By': 'FahimaApp128'},
-                    timeout=10
-                )
-                if resp.status_code != 200:
-                    self.stdout.write(f'  [SKIP] Player {pid}: HTTP {resp.status_code}')
-                    continue
-                data = resp.json()
-                pdata = data[0] if isinstance(data, list) and data else data
-                if not pdata or pdata.get('ID') != pid:
-                    self.stdout.write(f'  [SKIP] Player {pid}: unexpected response')
+                # Through the shared API client: its session keeps the
+                # connection alive and its throttle spaces the requests
+                pdata = fetch_player_profile_data(pid)
+                if pdata is None:
+                    reason = api_client.last_error or 'unexpected response'
+                    self.stdout.write(f'  [SKIP] Player {pid}: {reason}')
                     continue
                 Player.objects.get_or_create(
                     ID=pid,
@@ -234,46 +235,43 @@ class Command(BaseCommand):
         """Fix matches in tournaments that have ended but still show as running."""
         today = date.today()
         
-        # Find finished tournaments with running matches
-        # Use a 3-day grace period so qualifiers running past their EndDate aren't wrongly closed
+        # Running matches (STATUS_RUNNING) in tournaments that ended more than
+        # 3 days ago - the grace period keeps qualifiers running past their
+        # EndDate from being wrongly closed
         grace_cutoff = today - timedelta(days=3)
-        problem_events = Event.objects.filter(
-            EndDate__lt=grace_cutoff,  # Tournament ended more than 3 days ago
-            matches__Status=1  # Has running matches (STATUS_RUNNING)
-        ).distinct()
+        stuck_matches = MatchesOfAnEvent.objects.filter(
+            Event__EndDate__lt=grace_cutoff,
+            Status=1,
+        )
         
-        if not problem_events.exists():
+        # One GROUP BY gives the stuck count per finished tournament
+        problem_events = list(
+            stuck_matches.order_by('Event__EndDate').values('Event_id', 'Event__Name', 'Event__EndDate').annotate(stuck=Count('id'))
+        )
+        if not problem_events:
             return
             
-        self.stdout.write(f'Found {problem_events.count()} finished tournaments with stuck matches')
+        self.stdout.write(f'Found {len(problem_events)} finished tournaments with stuck matches')
         
-        total_fixed = 0
+        for row in problem_events:
+            days_ago = (today - row['Event__EndDate']).days
+            self.stdout.write(f'  Fixing {row["stuck"]} stuck matches in {row["Event__Name"]} (ended {days_ago} days ago)')
         
-        for event in problem_events:
-            days_ago = (today - event.EndDate).days
-            stuck_matches = MatchesOfAnEvent.objects.filter(
-                Event=event, 
-                Status=1  # STATUS_RUNNING only
-            )
-            
-            self.stdout.write(f'  Fixing {stuck_matches.count()} stuck matches in {event.Name} (ended {days_ago} days ago)')
-            
-            if not dry_run:
-                for match in stuck_matches:
-                    # Determine winner based on score
-                    if match.Score1 is not None and match.Score2 is not None:
-                        if match.Score1 > match.Score2:
-                            match.WinnerID = match.Player1ID
-                        elif match.Score2 > match.Score1:
-                            match.WinnerID = match.Player2ID
-                    
-                    # Set status to finished
-                    match.Status = 2  # STATUS_FINISHED
-                    match.Unfinished = False
-                    match.OnBreak = False
-                    match.save()
-                    
-                    total_fixed += 1
+        if dry_run:
+            return
+        
+        # A single UPDATE: mark finished and, where the score decides it, set
+        # the winner (otherwise WinnerID is left as it is)
+        total_fixed = stuck_matches.update(
+            Status=2,  # STATUS_FINISHED
+            Unfinished=False,
+            OnBreak=False,
+            WinnerID=Case(
+                When(Score1__gt=F('Score2'), then=F('Player1ID')),
+                When(Score2__gt=F('Score1'), then=F('Player2ID')),
+                default=F('WinnerID'),
+            ),
+        )
         
         if total_fixed > 0:
             self.stdout.write(
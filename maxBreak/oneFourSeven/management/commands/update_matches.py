@@ -13,12 +13,24 @@ from oneFourSeven.scraper import (
     fetch_event_matches_data,
     save_matches_of_an_event
 )
+from oneFourSeven.api_client import api_client
+from oneFourSeven.exceptions import NoDataYet, RateLimited, ServerError, SnookerAPIError
 from oneFourSeven.models import Event
-from oneFourSeven.constants import MIN_REQUEST_INTERVAL
 
 logger = logging.getLogger(__name__)
 
 
+def run_update_matches(stdout=None, **options):
+    """
+    In-process entry point for long-running callers (auto_live_monitor).
+    Takes the same option keys as handle() (event_id, active_only, empty_only,
+    ...) and skips call_command's command lookup and argparse. Unlike the
+    command line, an event_id with nothing published yet raises NoDataYet.
+    Returns the per-event results (see Command.update_events).
+    """
+    return Command(stdout=stdout).update_events(raise_no_data=True, **options)
+
+
 class Command(BaseCommand):
     help = 'Update match data for specific tournaments (faster than full database population)'
 
@@ -28,6 +40,10 @@ class Command(BaseCommand):
             type=int,
             help='Specific event ID to update matches for',
         )
+        parser.add_argument(
+            '--event-ids',
+            help='Comma-separated event IDs to update in one run (e.g. 123,456)',
+        )
         parser.add_argument(
             '--active-only',
             action='store_true',
@@ -56,12 +72,26 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
+        # From the shell or cron, "not published yet" is a warning with exit
+        # status 0 rather than a CommandError
+        self.update_events(**options)
+
+    def update_events(self, raise_no_data=False, **options):
+        """
+        Fetch and save matches for the selected events. Returns (and keeps on
+        ``self.results``) a dict of event ID -> None if the event was updated
+        or has nothing published yet, or an error message if it failed.
+        Events a RateLimited/ServerError stopped the batch before are absent.
+        With ``raise_no_data``, an --event-id with no matches raises NoDataYet.
+        """
+        self.results = {}
         self.stdout.write(
             self.style.SUCCESS('Starting matches update...')
         )
 
         dry_run = options.get('dry_run', False)
         event_id = options.get('event_id')
+        event_ids = options.get('event_ids')
         active_only = options.get('active_only', False)
         all_current = options.get('all_current', False)
         empty_only = options.get('empty_only', False)
@@ -69,17 +99,34 @@ class Command(BaseCommand):
 
         try:
             start_time = time.time()
+            # Only ID and Name are read from the events below, so only those
+            # columns are loaded
             events_to_update = []
 
             if event_id:
                 # Update specific event
                 try:
-                    event = Event.objects.get(ID=event_id)
+                    event = Event.objects.only('ID', 'Name').get(ID=event_id)
                     events_to_update = [event]
                     self.stdout.write(f'Updating matches for event: {event.Name} (ID: {event_id})')
                 except Event.DoesNotExist:
                     raise CommandError(f'Event with ID {event_id} not found in database')
 
+            elif event_ids:
+                # Update several specific events in one run, in the order given
+                try:
+                    ids = [int(i) for i in str(event_ids).split(',') if i.strip()]
+                except ValueError:
+                    raise CommandError(f'Invalid --event-ids value: {event_ids}')
+                events_by_id = Event.objects.only('ID', 'Name').in_bulk(ids)
+                missing = [i for i in ids if i not in events_by_id]
+                if missing:
+                    self.stdout.write(
+                        self.style.WARNING(f'Event(s) not found in database: {missing}')
+                    )
+                events_to_update = [events_by_id[i] for i in ids if i in events_by_id]
+                self.stdout.write(f'Updating matches for {len(events_to_update)} event(s)')
+
             elif active_only:
                 # Update all active events
                 from datetime import date
@@ -89,7 +136,7 @@ class Command(BaseCommand):
                     Event.objects.filter(
                         StartDate__lte=today,
                         EndDate__gte=today
-                    ).order_by('StartDate')[:max_events]
+                    ).order_by('StartDate').only('ID', 'Name')[:max_events]
                 )
                 
                 self.stdout.write(f'Found {len(events_to_update)} active tournament(s) to update')
@@ -103,7 +150,7 @@ class Command(BaseCommand):
                     Event.objects.filter(
                         Season=current_year,
                         Type__in=['Ranking', 'Qualifying', 'Invitational']
-                    ).order_by('StartDate')[:max_events]
+                    ).order_by('StartDate').only('ID', 'Name')[:max_events]
                 )
 
                 self.stdout.write(f'Found {len(events_to_update)} tournament(s) in current season to update')
@@ -124,19 +171,20 @@ class Command(BaseCommand):
                     Event.objects.exclude(ID__in=events_with_data)
                     .filter(Q(StartDate__lte=horizon) | Q(StartDate__isnull=True))
                     .order_by('-StartDate')
+                    .only('ID', 'Name')
                 )
                 self.stdout.write(f'Found {len(events_to_update)} event(s) with no match data to import (within 30-day horizon)')
 
             else:
                 raise CommandError(
-                    'Must specify one of: --event-id, --active-only, or --all-current'
+                    'Must specify one of: --event-id, --event-ids, --active-only, or --all-current'
                 )
 
             if not events_to_update:
                 self.stdout.write(
                     self.style.WARNING('No tournaments found to update')
                 )
-                return
+                return self.results
 
             if dry_run:
                 for event in events_to_update:
@@ -144,42 +192,55 @@ class Command(BaseCommand):
                 self.stdout.write(
                     self.style.WARNING('DRY RUN: No changes made')
                 )
-                return
+                return self.results
 
             # Update matches for each event
             updated_count = 0
             failed_count = 0
 
-            for i, event in enumerate(events_to_update):
+            # No sleep between events: the shared API client already spaces
+            # requests MIN_REQUEST_INTERVAL apart (snooker.org's 2/minute)
+            for event in events_to_update:
                 self.stdout.write(f'Updating matches for: {event.Name} (ID: {event.ID})')
                 
-                # Add rate limiting between requests (except for first request)
-                if i > 0:
-                    time.sleep(MIN_REQUEST_INTERVAL)  # Respect snooker.org's 2 requests/minute limit
-                
                 try:
                     matches_data = fetch_event_matches_data(event.ID)
                     
                     if matches_data is None:
+                        # Rate limiting or an outage won't clear up for the next
+                        # event either - stop the batch and let the caller back off
+                        if isinstance(api_client.last_error, (RateLimited, ServerError)):
+                            self.results[event.ID] = str(api_client.last_error)
+                            raise api_client.last_error
+                        if event_id and raise_no_data:
+                            raise NoDataYet(f'No matches published yet for event {event.ID}')
                         self.stdout.write(
                             self.style.WARNING(f'Failed to fetch matches for event {event.ID}')
                         )
+                        self.results[event.ID] = 'Failed to fetch matches'
                         failed_count += 1
                         continue
                     
                     if not matches_data:
+                        if event_id and raise_no_data:
+                            raise NoDataYet(f'No matches published yet for event {event.ID}')
                         self.stdout.write(f'No matches found for event {event.ID}')
+                        self.results[event.ID] = None
                         continue
                     
                     # Save matches
                     save_matches_of_an_event(event.ID, matches_data)
                     self.stdout.write(f'Updated {len(matches_data)} matches for event {event.ID}')
+                    self.results[event.ID] = None
                     updated_count += 1
                     
+                except SnookerAPIError:
+                    raise
                 except Exception as e:
                     self.stdout.write(
                         self.style.ERROR(f'Error updating event {event.ID}: {e}')
                     )
+                    self.results[event.ID] = str(e)
                     failed_count += 1
 
             end_time = time.time()
@@ -191,7 +252,10 @@ class Command(BaseCommand):
                     f'Updated: {updated_count}, Failed: {failed_count}'
                 )
             )
+            return self.results
 
+        except SnookerAPIError:
+            raise
         except Exception as e:
             logger.error(f"Error updating matches: {e}", exc_info=True)
             raise CommandError(f'Matches update failed: {e}')
\ No newline at end of file
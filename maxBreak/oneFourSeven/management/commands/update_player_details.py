@@ -3,10 +3,11 @@
 Django management command to update player photos and match history.
 Fetches data from API t=4 (player details with photos) and t=8 (match history).
 
-Rate limit: snooker.org allows ~10 requests/minute.
-All API calls go through _api_get() which enforces a 6-second delay before
-each call, keeping us safely under the limit regardless of how many players
-or seasons are being fetched.
+Rate limit: snooker.org allows 2 requests/minute.
+All API calls go through _api_get(), which waits for the shared API client's
+next request slot and reuses its keep-alive session, keeping us under the
+limit regardless of how many players or seasons are being fetched (or what
+else in the process is calling the API).
 
 Usage:
   python manage.py update_player_details --player-id 1
@@ -15,25 +16,30 @@ Usage:
 """
 
 import logging
-import time
-import requests
 from datetime import datetime
 from django.core.management.base import BaseCommand
 from django.db.models import Q
 from django.utils import timezone
 
 from oneFourSeven.models import Player, PlayerMatchHistory, Event, Ranking
+from oneFourSeven.api_client import api_client
 from oneFourSeven.constants import API_BASE_URL, HEADERS
 
 logger = logging.getLogger(__name__)
 
-# 30 seconds between calls = 2 calls/minute (snooker.org rate limit)
-API_CALL_DELAY = 30
-
 
 class Command(BaseCommand):
     help = 'Update player photos and match history from API'
 
+    # PlayerMatchHistory's unique_together (its logical key) and the columns
+    # refreshed when a fetched match already has a row
+    HISTORY_KEY = ['player_id', 'event_id', 'round_number', 'player1_id', 'player2_id']
+    HISTORY_UPDATE_FIELDS = [
+        'api_match_id', 'event_name', 'round_name', 'player1_name', 'score1',
+        'player2_name', 'score2', 'winner_id', 'status', 'scheduled_date',
+        'start_date', 'end_date', 'season', 'updated_at',
+    ]
+
     def add_arguments(self, parser):
         parser.add_argument(
             '--player-id',
@@ -121,11 +127,12 @@ class Command(BaseCommand):
     def _api_get(self, url):
         """
         Make a rate-limited GET request to snooker.org.
-        Sleeps BEFORE every call so back-to-back calls are always spaced out,
-        regardless of how many calls happen per player or per loop iteration.
+        Waits for the shared client's next slot BEFORE every call so back-to-back
+        calls are always spaced out, then sends it on the client's session so
+        the TCP/TLS connection is reused across calls.
         """
-        time.sleep(API_CALL_DELAY)
-        return requests.get(url, headers=HEADERS, timeout=15)
+        api_client.wait_for_request_slot()
+        return api_client.session.get(url, headers=HEADERS, timeout=15)
 
     def _update_player_photo(self, player):
         """Fetch and update player photo from API t=4"""
@@ -166,6 +173,8 @@ class Command(BaseCommand):
             seasons_to_fetch = [current_year - 1 - i for i in range(seasons_count)]
 
             total_matches = 0
+            rows = {}
+            unkeyed = []
 
             for season in seasons_to_fetch:
                 url = f"{API_BASE_URL}?t=8&p={player.ID}&s={season}"
@@ -197,49 +206,81 @@ class Command(BaseCommand):
                     dist = event_max_round.get(event_id, 0) - round_number
                     return ROUND_NAMES[dist] if 0 <= dist < len(ROUND_NAMES) else f'Round {round_number}'
 
+                # Event and player names for the whole season, one IN query each
+                # (instead of an Event and two Player lookups per match)
+                event_names = dict(
+                    Event.objects.filter(
+                        ID__in={m.get('EventID') for m in matches_data if m.get('EventID')}
+                    ).order_by().values_list('ID', 'Name')
+                )
+                player_names = self._load_player_names(
+                    {m.get(k) for m in matches_data for k in ('Player1ID', 'Player2ID')}
+                )
+
                 matches_saved = 0
                 for match_data in matches_data:
                     try:
-                        event_name = None
                         event_id = match_data.get('EventID')
-                        if event_id:
-                            try:
-                                event = Event.objects.get(ID=event_id)
-                                event_name = event.Name
-                            except Event.DoesNotExist:
-                                pass
-
-                        PlayerMatchHistory.objects.update_or_create(
+                        event_name = event_names.get(event_id)
+
+                        row = PlayerMatchHistory(
                             api_match_id=match_data.get('ID'),
                             player_id=player.ID,
-                            defaults={
-                                'event_id': event_id,
-                                'event_name': event_name,
-                                'round_number': match_data.get('Round'),
-                                'round_name': infer_round_name(event_id, match_data.get('Round')),
-                                'player1_id': match_data.get('Player1ID'),
-                                'player1_name': self._get_player_name(match_data.get('Player1ID')),
-                                'score1': match_data.get('Score1'),
-                                'player2_id': match_data.get('Player2ID'),
-                                'player2_name': self._get_player_name(match_data.get('Player2ID')),
-                                'score2': match_data.get('Score2'),
-                                'winner_id': match_data.get('WinnerID'),
-                                'status': match_data.get('Status', 0),
-                                'scheduled_date': self._parse_date(match_data.get('ScheduledDate')),
-                                'start_date': self._parse_date(match_data.get('StartDate')),
-                                'end_date': self._parse_date(match_data.get('EndDate')),
-                                'season': season,
-                            }
+                            event_id=event_id,
+                            event_name=event_name,
+                            round_number=match_data.get('Round'),
+                            round_name=infer_round_name(event_id, match_data.get('Round')),
+                            player1_id=match_data.get('Player1ID'),
+                            player1_name=self._get_player_name(match_data.get('Player1ID'), player_names),
+                            score1=match_data.get('Score1'),
+                            player2_id=match_data.get('Player2ID'),
+                            player2_name=self._get_player_name(match_data.get('Player2ID'), player_names),
+                            score2=match_data.get('Score2'),
+                            winner_id=match_data.get('WinnerID'),
+                            status=match_data.get('Status', 0),
+                            scheduled_date=self._parse_date(match_data.get('ScheduledDate')),
+                            start_date=self._parse_date(match_data.get('StartDate')),
+                            end_date=self._parse_date(match_data.get('EndDate')),
+                            season=season,
                         )
+                        key = tuple(getattr(row, f) for f in self.HISTORY_KEY)
+                        if None in key:
+                            # NULLs never conflict in a unique index, so the
+                            # upsert can't find these rows; match on the API ID
+                            unkeyed.append(row)
+                        else:
+                            # One row per logical key; a repeat later in the data wins
+                            rows[key] = row
                         matches_saved += 1
 
                     except Exception as e:
-                        logger.error(f'Failed to save match {match_data.get("ID")}: {str(e)}')
+                        logger.error(f'Failed to prepare match {match_data.get("ID")}: {str(e)}')
                         continue
 
-                self.stdout.write(f'  [MATCHES] Season {season}: {matches_saved} matches saved')
+                self.stdout.write(f'  [MATCHES] Season {season}: {matches_saved} matches fetched')
                 total_matches += matches_saved
 
+            # Every season's matches in one upsert on the model's logical key
+            # (api_match_id rotates, so it is updated rather than matched on)
+            if rows:
+                PlayerMatchHistory.objects.bulk_create(
+                    rows.values(),
+                    update_conflicts=True,
+                    unique_fields=self.HISTORY_KEY,
+                    update_fields=self.HISTORY_UPDATE_FIELDS,
+                    batch_size=1000,
+                )
+            for row in unkeyed:
+                try:
+                    PlayerMatchHistory.objects.update_or_create(
+                        api_match_id=row.api_match_id,
+                        player_id=row.player_id,
+                        defaults={f: getattr(row, f) for f in self.HISTORY_KEY + self.HISTORY_UPDATE_FIELDS
+                                  if f not in ('api_match_id', 'player_id', 'updated_at')},
+                    )
+                except Exception as e:
+                    logger.error(f'Failed to save match {row.api_match_id}: {str(e)}')
+
             if total_matches > 0:
                 self.stdout.write(f'  [MATCHES] Total: {total_matches} matches updated')
                 return True
@@ -260,12 +301,15 @@ class Command(BaseCommand):
         except Exception:
             return None
 
-    def _get_player_name(self, player_id):
-        """Get player name from database"""
+    def _load_player_names(self, player_ids):
+        """Map player ID -> display name for the given IDs, in one query."""
+        players = Player.objects.filter(ID__in=[pid for pid in player_ids if pid]).order_by().only(
+            'ID', 'FirstName', 'MiddleName', 'LastName'
+        )
+        return {player.ID: str(player) for player in players}
+
+    def _get_player_name(self, player_id, player_names):
+        """Get player name from the names preloaded by _load_player_names"""
         if not player_id:
             return "Unknown"
-        try:
-            player = Player.objects.get(ID=player_id)
-            return str(player)
-        except Player.DoesNotExist:
-            return f"Player {player_id}"
+        return player_names.get(player_id, f"Player {player_id}")
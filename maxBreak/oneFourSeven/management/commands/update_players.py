@@ -3,6 +3,7 @@
 Django management command to update only player data.
 This command is faster than the full populate_db script as it only updates player information.
 Usage: python manage.py update_players
+       python manage.py update_players --status pro --sex men women
 """
 
 import logging
@@ -18,11 +19,19 @@ from oneFourSeven.scraper import (
     SE_PLAYER_MEN,
     SE_PLAYER_WOMEN
 )
-from oneFourSeven.constants import MIN_REQUEST_INTERVAL
 
 logger = logging.getLogger(__name__)
 
 
+def run_update_players(stdout=None, **options):
+    """
+    In-process entry point for other commands (tournament_end_ranking_update).
+    Takes the same option keys as handle() (season, status, sex, ...) and
+    skips call_command's command lookup and argparse.
+    """
+    Command(stdout=stdout).handle(**options)
+
+
 class Command(BaseCommand):
     help = 'Update player data only (faster than full database population)'
 
@@ -47,9 +56,10 @@ class Command(BaseCommand):
         parser.add_argument(
             '--sex',
             type=str,
+            nargs='+',
             choices=['men', 'women', 'all'],
-            default='all',
-            help='Player gender to update (default: all)',
+            default=['all'],
+            help='Player gender(s) to update, e.g. --sex men women (default: all)',
         )
 
     def handle(self, *args, **options):
@@ -59,7 +69,12 @@ class Command(BaseCommand):
 
         dry_run = options.get('dry_run', False)
         status_filter = options.get('status', 'all')
-        sex_filter = options.get('sex', 'all')
+        sex_filter = options.get('sex') or ['all']
+        if isinstance(sex_filter, str):
+            # call_command(..., sex='men') bypasses argparse's nargs list
+            sex_filter = [sex_filter]
+        want_men = 'men' in sex_filter or 'all' in sex_filter
+        want_women = 'women' in sex_filter or 'all' in sex_filter
         season = options.get('season')
 
         try:
@@ -84,28 +99,26 @@ class Command(BaseCommand):
             categories = []
             
             if status_filter in ['pro', 'all']:
-                if sex_filter in ['men', 'all']:
+                if want_men:
                     categories.append(('Professional Men', ST_PLAYER_PRO, SE_PLAYER_MEN))
-                if sex_filter in ['women', 'all']:
+                if want_women:
                     categories.append(('Professional Women', ST_PLAYER_PRO, SE_PLAYER_WOMEN))
             
             if status_filter in ['amateur', 'all']:
-                if sex_filter in ['men', 'all']:
+                if want_men:
                     categories.append(('Amateur Men', ST_PLAYER_AMATEUR, SE_PLAYER_MEN))
-                if sex_filter in ['women', 'all']:
+                if want_women:
                     categories.append(('Amateur Women', ST_PLAYER_AMATEUR, SE_PLAYER_WOMEN))
 
             all_players = []
-            total_fetched = 0
 
-            # Fetch players for each category
+            # Fetch players for each category. No sleep here: the shared API
+            # client starts each request MIN_REQUEST_INTERVAL after the previous
+            # one started, so the next category's wait overlaps this one's
+            # download instead of following it.
             for category_name, status, sex in categories:
                 self.stdout.write(f'Fetching {category_name}...')
                 
-                # Add rate limiting between requests
-                if total_fetched > 0:
-                    time.sleep(MIN_REQUEST_INTERVAL)  # Respect snooker.org's 2 requests/minute limit
-                
                 players_data = fetch_players_data(season, status, sex)
                 
                 if players_data is None:
@@ -117,7 +130,6 @@ class Command(BaseCommand):
                 if players_data:
                     all_players.extend(players_data)
                     self.stdout.write(f'Fetched {len(players_data)} {category_name}')
-                    total_fetched += 1
                 else:
                     self.stdout.write(f'No {category_name} found')
 
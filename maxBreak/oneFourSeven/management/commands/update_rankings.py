@@ -20,6 +20,15 @@ from oneFourSeven.constants import ALL_RANKING_TYPES, MIN_REQUEST_INTERVAL
 logger = logging.getLogger(__name__)
 
 
+def run_update_rankings(stdout=None, **options):
+    """
+    In-process entry point for other commands (tournament_end_ranking_update).
+    Takes the same option keys as handle() (season, ranking_type,
+    current_season_only, ...) and skips call_command's command lookup and argparse.
+    """
+    Command(stdout=stdout).handle(**options)
+
+
 class Command(BaseCommand):
     help = 'Update player rankings data only (faster than full database population)'
 
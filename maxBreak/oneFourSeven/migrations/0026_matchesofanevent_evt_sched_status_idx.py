@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oneFourSeven', '0025_devicetoken_favorite_match_db_ids_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='matchesofanevent',
+            index=models.Index(fields=['Event', 'ScheduledDate', 'Status'], name='moe_evt_sched_status_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oneFourSeven', '0026_matchesofanevent_evt_sched_status_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduledJobRun',
+            fields=[
+                ('job_name', models.CharField(max_length=32, primary_key=True, serialize=False)),
+                ('last_run', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Scheduled Job Run',
+            },
+        ),
+    ]
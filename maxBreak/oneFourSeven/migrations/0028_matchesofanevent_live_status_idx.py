@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oneFourSeven', '0027_scheduledjobrun'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='matchesofanevent',
+            index=models.Index(condition=models.Q(('Status__in', [0, 1, 2])), fields=['ScheduledDate'], name='moe_live_status_idx'),
+        ),
+    ]
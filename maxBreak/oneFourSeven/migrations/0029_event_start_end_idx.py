@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oneFourSeven', '0028_matchesofanevent_live_status_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['StartDate', 'EndDate'], name='event_start_end_idx'),
+        ),
+    ]
@@ -2,6 +2,7 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone # Keep for potential future use with default/auto_now
+from datetime import timedelta
 import json
 
 # ================== Player Model ==================
@@ -327,8 +328,30 @@ class Event(models.Model):
         verbose_name = "Event"
         verbose_name_plural = "Events"
         ordering = ['-Season', 'StartDate', 'Name'] # Order by season desc, then date asc, then name
+        indexes = [
+            # "Active tournament" windows (StartDate <= d AND EndDate >= d'),
+            # used by the daily/live update commands: EndDate is checked in the index
+            models.Index(fields=['StartDate', 'EndDate'], name='event_start_end_idx'),
+        ]
 
 # ================== MatchesOfAnEvent Model ==================
+class MatchesQuerySet(models.QuerySet):
+    """Shared filters for event matches."""
+
+    def live_window(self, now):
+        """
+        Matches that should be live at ``now``: still live-eligible and
+        scheduled between 4 hours ago and 15 minutes from now (they
+        sometimes start early). The window is a plain ScheduledDate range,
+        so it is checked in SQL rather than per match in Python.
+        """
+        return self.filter(
+            Status__in=self.model.LIVE_ELIGIBLE_STATUSES,
+            ScheduledDate__gte=now - timedelta(hours=4),
+            ScheduledDate__lte=now + timedelta(minutes=15),
+        )
+
+
 class MatchesOfAnEvent(models.Model):
     """
     Represents a specific match within an event, including players, scores, schedule, and status.
@@ -399,6 +422,9 @@ class MatchesOfAnEvent(models.Model):
     STATUS_RUNNING = 1
     STATUS_FINISHED = 2
     STATUS_UNKNOWN = 3 # Or other specific meanings
+    # Statuses the live monitors still poll: scheduled, running, on break
+    # (the monitors treat 2 as a break and 3 as finished)
+    LIVE_ELIGIBLE_STATUSES = [0, 1, 2]
     STATUS_CHOICES = [
         (STATUS_SCHEDULED, 'Scheduled'),
         (STATUS_RUNNING, 'Running / Live'),
@@ -442,6 +468,8 @@ class MatchesOfAnEvent(models.Model):
     )
     # -----------------------------
 
+    objects = MatchesQuerySet.as_manager()
+
 
     def __str__(self) -> str:
         """Detailed string representation for admin/debugging."""
@@ -477,6 +505,13 @@ class MatchesOfAnEvent(models.Model):
             models.Index(fields=['Player1ID']), # Index for finding player matches
             models.Index(fields=['Player2ID']), # Index for finding player matches
             models.Index(fields=['api_match_id']), # Index for finding by API ID
+            # Live-monitor hot query: an event's matches in a ScheduledDate window by Status
+            models.Index(fields=['Event', 'ScheduledDate', 'Status'], name='moe_evt_sched_status_idx'),
+            # Partial index: finished matches dominate the table, live queries never want them
+            models.Index(
+                fields=['ScheduledDate'], name='moe_live_status_idx',
+                condition=models.Q(Status__in=[0, 1, 2]),  # LIVE_ELIGIBLE_STATUSES
+            ),
         ]
 
 
@@ -1095,6 +1130,25 @@ class NotifDedup(models.Model):
         return f"{self.event_type} | match {self.api_match_id} | {self.sent_date}"
 
 
+# ================== ScheduledJobRun Model ==================
+class ScheduledJobRun(models.Model):
+    """
+    Persists when an auto_live_monitor periodic job last completed, so a restart
+    inside the job's window doesn't run it again. One row per job (PK lookup).
+    """
+    DAILY = 'daily'
+    MONTHLY = 'monthly'
+
+    job_name = models.CharField(max_length=32, primary_key=True)
+    last_run = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Scheduled Job Run"
+
+    def __str__(self):
+        return f"{self.job_name} | {self.last_run}"
+
+
 # ================== UserFavorite Model ==================
 class UserFavorite(models.Model):
     """
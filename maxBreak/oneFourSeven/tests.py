@@ -1,8 +1,8 @@
 from django.test import TestCase
 from django.utils import timezone
 from rest_framework.test import APIClient
-from unittest.mock import patch, MagicMock
-from datetime import date, timedelta
+from unittest.mock import ANY, patch, MagicMock
+from datetime import date, datetime, timedelta
 from io import StringIO
 
 from .models import Player, PlayerMatchHistory
@@ -108,6 +108,22 @@ class CheckDailyUpdatesTest(TestCase):
         mock_run.assert_called_once()
 
 
+    @patch(
+        'oneFourSeven.management.commands.auto_live_monitor.Command._run_daily_updates'
+    )
+    def test_skips_after_restart_when_persisted_run_today(self, mock_run):
+        """A fresh process (no last_daily_run) must not rerun a job recorded today."""
+        from .models import ScheduledJobRun
+        fake_now = timezone.now().replace(hour=3, minute=0, second=0, microsecond=0)
+        ScheduledJobRun.objects.create(job_name=ScheduledJobRun.DAILY, last_run=fake_now)
+        cmd = _make_monitor()
+
+        result = cmd._check_daily_updates(fake_now + timedelta(minutes=30))
+
+        self.assertFalse(result)
+        mock_run.assert_not_called()
+        self.assertEqual(cmd.last_daily_run, fake_now.date())
+
 # ---------------------------------------------------------------------------
 # Tests: _check_monthly_updates uses instance variable (not Player.created_at)
 # ---------------------------------------------------------------------------
@@ -167,6 +183,583 @@ class CheckMonthlyUpdatesTest(TestCase):
         mock_run.assert_not_called()
 
 
+# ---------------------------------------------------------------------------
+# Tests: idle-job schedule only calls checks whose next run time has come
+# ---------------------------------------------------------------------------
+
+class CheckUpcomingTournamentUpdatesTest(TestCase):
+    """The upcoming-tournament check queries at most once per even hour."""
+
+    def test_second_call_same_hour_skips_db(self):
+        cmd = _make_monitor()
+        fake_now = timezone.now().replace(hour=10, minute=5)
+        with patch('oneFourSeven.management.commands.auto_live_monitor.timezone.now', return_value=fake_now):
+            self.assertFalse(cmd._check_upcoming_tournament_updates())
+            with self.assertNumQueries(0):
+                self.assertFalse(cmd._check_upcoming_tournament_updates())
+
+    def test_odd_hour_skips_db(self):
+        cmd = _make_monitor()
+        fake_now = timezone.now().replace(hour=11, minute=5)
+        with patch('oneFourSeven.management.commands.auto_live_monitor.timezone.now', return_value=fake_now):
+            with self.assertNumQueries(0):
+                self.assertFalse(cmd._check_upcoming_tournament_updates())
+
+
+class UpcomingMatchesFallbackTest(TestCase):
+    """The fallback freshness check hits the DB once per process, not per tick."""
+
+    @patch('oneFourSeven.management.commands.auto_live_monitor.call_command')
+    def test_recent_refresh_skips_without_query(self, mock_call):
+        cmd = _make_monitor()
+        cmd._update_upcoming_matches_fallback()  # empty table -> refresh
+        mock_call.assert_called_once_with('update_upcoming_matches', '--tour', 'main')
+
+        with self.assertNumQueries(0):
+            cmd._update_upcoming_matches_fallback()
+        mock_call.assert_called_once()
+
+
+class IdleJobScheduleTest(TestCase):
+    """Verify _run_due_jobs fires due checks once and re-arms them."""
+
+    def _patch_checks(self, cmd):
+        for method_name, _, _ in cmd.IDLE_JOBS:
+            setattr(cmd, method_name, MagicMock(return_value=False))
+
+    def test_all_jobs_due_on_boot(self):
+        cmd = _make_monitor()
+        self._patch_checks(cmd)
+        now = timezone.now()
+        cmd._init_schedule(now)
+        cmd._run_due_jobs(now)
+
+        for method_name, _, _ in cmd.IDLE_JOBS:
+            getattr(cmd, method_name).assert_called_once()
+
+    def test_rearmed_jobs_not_called_again_same_tick(self):
+        cmd = _make_monitor()
+        self._patch_checks(cmd)
+        now = timezone.now()
+        cmd._init_schedule(now)
+        cmd._run_due_jobs(now)
+        cmd._run_due_jobs(now + timedelta(minutes=15))
+
+        cmd._check_daily_updates.assert_called_once()
+        cmd._check_monthly_updates.assert_called_once()
+        self.assertTrue(all(run_at > now for run_at, _ in cmd._schedule))
+
+    def test_idle_sleep_wakes_for_next_job(self):
+        cmd = _make_monitor()
+        now = timezone.now()
+        cmd._schedule = [(now + timedelta(minutes=5), 0)]
+        self.assertEqual(cmd._idle_sleep_seconds(now, 900), 300)
+        cmd._schedule = [(now + timedelta(hours=2), 0)]
+        self.assertEqual(cmd._idle_sleep_seconds(now, 900), 900)
+
+    def test_next_daily_run_is_2am(self):
+        from oneFourSeven.management.commands.auto_live_monitor import _next_daily_run
+        now = timezone.now().replace(hour=10, minute=0, second=0, microsecond=0)
+        run = _next_daily_run(now)
+        self.assertEqual((run.hour, run.date()), (2, now.date() + timedelta(days=1)))
+
+
+class ComprehensiveAutomationScheduleTest(TestCase):
+    """The scheduler keeps absolute next-trigger times in Israel time."""
+
+    CMD = 'oneFourSeven.management.commands.comprehensive_automation'
+
+    def _scheduled_at(self, now):
+        from oneFourSeven.management.commands.comprehensive_automation import Command
+        cmd = Command()
+        cmd.stdout = StringIO()
+        with patch(f'{self.CMD}.datetime') as mock_dt:
+            mock_dt.now.return_value = now
+            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+            cmd._schedule_all_tasks()
+        return cmd
+
+    def test_initial_triggers(self):
+        from zoneinfo import ZoneInfo
+        tz = ZoneInfo('Asia/Jerusalem')
+        # Sunday 1 June 2025, 05:10 - inside the weekly window, monthly missed
+        cmd = self._scheduled_at(datetime(2025, 6, 1, 5, 10, tzinfo=tz))
+        self.assertEqual(cmd._next_daily, datetime(2025, 6, 1, 6, tzinfo=tz))
+        self.assertEqual(cmd._next_weekly, datetime(2025, 6, 1, 5, tzinfo=tz))
+        self.assertEqual(cmd._next_monthly, datetime(2025, 7, 1, 4, tzinfo=tz))
+
+    def test_advance_skips_missed_runs(self):
+        from oneFourSeven.management.commands.comprehensive_automation import Command
+        from zoneinfo import ZoneInfo
+        tz = ZoneInfo('Asia/Jerusalem')
+        trigger = datetime(2025, 3, 1, 6, tzinfo=tz)
+        now = datetime(2025, 3, 3, 7, tzinfo=tz)
+        self.assertEqual(Command._advance(trigger, now, timedelta(days=1)), datetime(2025, 3, 4, 6, tzinfo=tz))
+
+
+class FixScoreInconsistenciesTest(TestCase):
+    """Winner fixes are written as one UPDATE per fix type."""
+
+    def setUp(self):
+        from .models import Event, MatchesOfAnEvent
+        event = Event.objects.create(ID=9100, Name='Test Open', Season=2025)
+        rows = [
+            # (Score1, Score2, WinnerID) for players 1 and 2
+            (4, 1, 2),   # Player 1 won, winner points to Player 2
+            (1, 4, 1),   # Player 2 won, winner points to Player 1
+            (2, 2, 1),   # tied, but has a winner
+            (4, 0, 1),   # already consistent
+        ]
+        for number, (s1, s2, winner) in enumerate(rows, start=1):
+            MatchesOfAnEvent.objects.create(
+                Event=event, Round=1, Number=number, Status=3,
+                Player1ID=1, Player2ID=2, Score1=s1, Score2=s2, WinnerID=winner,
+            )
+
+    def test_fixes_each_kind(self):
+        from django.core.management import call_command
+        from .models import MatchesOfAnEvent
+        with patch('builtins.input', return_value='y'):
+            call_command('fix_score_inconsistencies', stdout=StringIO())
+        self.assertEqual(
+            list(MatchesOfAnEvent.objects.order_by('Number').values_list('WinnerID', flat=True)),
+            [1, 2, None, 1],
+        )
+
+    def test_dry_run_reads_matches_once(self):
+        from django.core.management import call_command
+        Player.objects.create(ID=1, FirstName='Florian', LastName='Nüßle')
+        Player.objects.create(ID=2, FirstName='Judd', LastName='Trump')
+        out = StringIO()
+        # One streaming SELECT of the matches, then names for the printed rows
+        with self.assertNumQueries(2):
+            call_command('fix_score_inconsistencies', '--dry-run', stdout=out)
+        output = out.getvalue()
+        self.assertIn('Current: Florian Nüßle 4-1 Judd Trump', output)
+        # The count header introduces the details that follow it
+        self.assertLess(output.index('Found 3 inconsistent matches:'), output.index('Current:'))
+        self.assertNotIn('Not Found', output)
+        self.assertIn('3 matches would be fixed', output)
+
+
+class UpdateMatchesEventIdsTest(TestCase):
+    """--event-ids updates several events in one run, skipping unknown IDs."""
+
+    CMD = 'oneFourSeven.management.commands.update_matches'
+
+    def test_updates_each_listed_event(self):
+        from django.core.management import call_command
+        from .models import Event
+        Event.objects.create(ID=9201, Name='First Open')
+        Event.objects.create(ID=9202, Name='Second Open')
+        with patch(f'{self.CMD}.fetch_event_matches_data', return_value=[{'ID': 1}]) as fetch, \
+             patch(f'{self.CMD}.save_matches_of_an_event') as save:
+            call_command('update_matches', '--event-ids', '9202,9999,9201', stdout=StringIO())
+        self.assertEqual([c.args[0] for c in fetch.call_args_list], [9202, 9201])
+        self.assertEqual(save.call_count, 2)
+
+    def test_unpublished_event_warns_on_command_line(self):
+        from django.core.management import call_command
+        from .exceptions import NoDataYet
+        from .management.commands.update_matches import run_update_matches
+        from .models import Event
+        Event.objects.create(ID=9203, Name='Future Open')
+        out = StringIO()
+        with patch(f'{self.CMD}.fetch_event_matches_data', return_value=[]):
+            call_command('update_matches', '--event-id', '9203', stdout=out)
+            self.assertIn('No matches found for event 9203', out.getvalue())
+            # In-process callers still get the exception to back off on
+            with self.assertRaises(NoDataYet):
+                run_update_matches(event_id=9203, stdout=StringIO())
+
+
+class DailyMatchesUpdateTest(TestCase):
+    """The daily batch still reports each event as updated or failed."""
+
+    CMD = 'oneFourSeven.management.commands.update_matches'
+
+    def test_reports_each_event(self):
+        from django.core.management import call_command
+        from .api_client import api_client
+        from .exceptions import RateLimited
+        from .models import Event
+        for event_id, name in ((9211, 'Alpha Open'), (9212, 'Beta Open'), (9213, 'Gamma Open')):
+            Event.objects.create(ID=event_id, Name=name, StartDate=date.today(), EndDate=date.today())
+        self.addCleanup(setattr, api_client, 'last_error', None)
+
+        def fetch(event_id):
+            api_client.last_error = RateLimited('HTTP 429') if event_id == 9213 else None
+            return [{'ID': 1}] if event_id == 9211 else None
+
+        out = StringIO()
+        with patch(f'{self.CMD}.fetch_event_matches_data', side_effect=fetch), \
+             patch(f'{self.CMD}.save_matches_of_an_event'):
+            call_command('daily_matches_update', stdout=out)
+        output = out.getvalue()
+        self.assertIn('✅ Updated Alpha Open', output)
+        self.assertIn('❌ Failed Beta Open: Failed to fetch matches', output)
+        self.assertIn('❌ Failed Gamma Open: HTTP 429', output)
+        self.assertIn('COMPLETE: 1 updated, 2 failed', output)
+
+
+class ActiveEventsCacheTest(TestCase):
+    """Active events are cached per day and dropped when events are saved."""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from .models import Event
+        cache.clear()
+        self.today = date(2025, 3, 10)
+        Event.objects.create(ID=9301, Name='Running Open', StartDate=self.today, EndDate=self.today)
+
+    def test_cached_until_events_saved(self):
+        from .active_events import get_active_events
+        from .data_savers import save_events
+        self.assertEqual([e.ID for e in get_active_events(self.today)], [9301])
+
+        with self.assertNumQueries(0):
+            get_active_events(self.today)
+
+        with patch('oneFourSeven.data_savers.date') as mock_date:
+            mock_date.today.return_value = self.today
+            save_events([{'ID': 9302, 'Name': 'New Open', 'StartDate': '2025-03-11', 'EndDate': '2025-03-12'}])
+        self.assertEqual([e.ID for e in get_active_events(self.today)], [9301, 9302])
+
+
+class MatchesLiveWindowTest(TestCase):
+    """live_window keeps live-eligible matches scheduled in [now-4h, now+15m]."""
+
+    def test_window_bounds_and_status(self):
+        from .models import Event, MatchesOfAnEvent
+        now = timezone.now()
+        event = Event.objects.create(ID=9401, Name='Window Open')
+        for number, (offset, status) in enumerate([
+            (timedelta(hours=-3), 1),       # running, in window
+            (timedelta(minutes=10), 0),     # starting soon
+            (timedelta(hours=-5), 1),       # too old
+            (timedelta(minutes=30), 0),     # too far ahead
+            (timedelta(hours=-1), 3),       # already finished
+        ], start=1):
+            MatchesOfAnEvent.objects.create(
+                Event=event, Round=1, Number=number, ScheduledDate=now + offset, Status=status,
+            )
+        self.assertEqual(
+            sorted(event.matches.live_window(now).values_list('Number', flat=True)), [1, 2]
+        )
+
+
+class SmartLiveSchedulerTickTest(TestCase):
+    """An event refreshed as live is not refreshed again by the stuck-match cleanup."""
+
+    CMD = 'oneFourSeven.management.commands.smart_live_scheduler'
+
+    def test_event_updated_once_per_tick(self):
+        from .models import Event, MatchesOfAnEvent
+        from .management.commands.smart_live_scheduler import Command
+        now = timezone.now()
+        event = Event.objects.create(ID=9501, Name='Busy Open', StartDate=now.date(), EndDate=now.date())
+        stale = Event.objects.create(ID=9502, Name='Stale Open')
+        MatchesOfAnEvent.objects.create(Event=event, Round=1, Number=1, ScheduledDate=now, Status=1)
+        MatchesOfAnEvent.objects.create(Event=event, Round=1, Number=2, ScheduledDate=now - timedelta(hours=6), Status=1)
+        MatchesOfAnEvent.objects.create(Event=stale, Round=1, Number=1, ScheduledDate=now - timedelta(hours=6), Status=2)
+
+        with patch(f'{self.CMD}.get_active_events', return_value=[event]), \
+             patch(f'{self.CMD}.run_update_matches') as update:
+            command = Command()
+            command.stdout = StringIO()
+            command._run_monitoring_check(now)
+        self.assertEqual([c.kwargs['event_id'] for c in update.call_args_list], [9501, 9502])
+
+    def test_quiet_sleep_capped_by_check_interval(self):
+        from .models import Event, MatchesOfAnEvent
+        from .management.commands.smart_live_scheduler import Command
+        now = timezone.now()
+        event = Event.objects.create(ID=9503, Name='Later Open')
+        MatchesOfAnEvent.objects.create(Event=event, Round=1, Number=1, ScheduledDate=now + timedelta(hours=5), Status=0)
+        command = Command()
+        self.assertEqual(command._compute_next_sleep(now, 600), 600)
+        self.assertEqual(command._compute_next_sleep(now, 600, quiet_backoff=True), Command.MAX_QUIET_SLEEP)
+
+
+class FixFinishedTournamentsTest(TestCase):
+    """Running matches in long-finished events are closed in one UPDATE."""
+
+    def test_closes_stuck_matches_and_sets_winner(self):
+        from .models import Event, MatchesOfAnEvent
+        from .management.commands.update_live_matches import Command
+        ended = date.today() - timedelta(days=10)
+        old = Event.objects.create(ID=9601, Name='Old Open', StartDate=ended, EndDate=ended)
+        recent = Event.objects.create(ID=9602, Name='Recent Open', StartDate=date.today(), EndDate=date.today())
+        won = MatchesOfAnEvent.objects.create(
+            Event=old, Round=1, Number=1, Status=1, Score1=2, Score2=4, Player1ID=11, Player2ID=22, OnBreak=True,
+        )
+        level = MatchesOfAnEvent.objects.create(
+            Event=old, Round=1, Number=2, Status=1, Score1=3, Score2=3, Player1ID=11, Player2ID=22, WinnerID=11,
+        )
+        ongoing = MatchesOfAnEvent.objects.create(Event=recent, Round=1, Number=1, Status=1)
+
+        command = Command()
+        command.stdout = StringIO()
+        with self.assertNumQueries(2):
+            command._fix_finished_tournaments()
+
+        won.refresh_from_db()
+        level.refresh_from_db()
+        ongoing.refresh_from_db()
+        self.assertEqual((won.Status, won.WinnerID, won.OnBreak), (2, 22, False))
+        self.assertEqual((level.Status, level.WinnerID), (2, 11))
+        self.assertEqual(ongoing.Status, 1)
+
+
+class SaveMatchesTest(TestCase):
+    """save_matches writes an event's matches in bulk and skips unchanged payloads."""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from .models import Event
+        cache.clear()
+        Event.objects.create(ID=9701, Name='Repeat Open')
+
+    def test_identical_payload_skips_database(self):
+        from .data_savers import save_matches_of_an_event
+        payload = [{'ID': 1, 'Round': 1, 'Number': 1, 'Score1': 1, 'Score2': 0, 'Status': 1}]
+        self.assertEqual(save_matches_of_an_event(9701, payload)['created'], 1)
+
+        with self.assertNumQueries(0):
+            stats = save_matches_of_an_event(9701, payload)
+        self.assertEqual(stats['skipped'], 1)
+
+        payload[0]['Score1'] = 2
+        self.assertEqual(save_matches_of_an_event(9701, payload)['updated'], 1)
+
+    def test_mixed_payload_creates_updates_and_skips(self):
+        from .data_savers import save_matches_of_an_event
+        from .models import MatchesOfAnEvent
+        MatchesOfAnEvent.objects.create(Event_id=9701, Round=1, Number=1, Status=1, Score1=0, Score2=0)
+        MatchesOfAnEvent.objects.create(Event_id=9701, Round=1, Number=2, Status=3, Score1=4, Score2=1)
+        stats = save_matches_of_an_event(9701, [
+            {'ID': 11, 'Round': 1, 'Number': 1, 'Score1': 3, 'Score2': 2, 'Status': 1},
+            {'ID': 12, 'Round': 1, 'Number': 2, 'Score1': 0, 'Score2': 0, 'Status': 0},  # would downgrade
+            {'ID': 13, 'Round': 1, 'Number': 3, 'Status': 0},
+        ])
+        self.assertEqual((stats['created'], stats['updated'], stats['skipped']), (1, 1, 1))
+        scores = dict(MatchesOfAnEvent.objects.values_list('Number', 'Score1'))
+        self.assertEqual(scores, {1: 3, 2: 4, 3: None})
+
+    def test_concurrent_insert_fails_and_is_retried(self):
+        from django.core.cache import cache
+        from .data_savers import _match_payload_key, save_matches_of_an_event
+        from .models import MatchesOfAnEvent
+        bulk_create = MatchesOfAnEvent.objects.bulk_create
+
+        def racing_bulk_create(objs, **kwargs):
+            # Another poller stores the same match between our SELECT and INSERT
+            MatchesOfAnEvent.objects.create(Event_id=9701, Round=1, Number=1, Status=0)
+            return bulk_create(objs, **kwargs)
+
+        payload = [{'ID': 21, 'Round': 1, 'Number': 1, 'Score1': 2, 'Score2': 1, 'Status': 1}]
+        with patch.object(MatchesOfAnEvent.objects, 'bulk_create', side_effect=racing_bulk_create), \
+             self.assertLogs('oneFourSeven.data_savers', 'ERROR'):
+            stats = save_matches_of_an_event(9701, payload)
+        self.assertEqual((stats['created'], stats['failed']), (0, 1))
+        self.assertIsNone(cache.get(_match_payload_key(9701)))
+
+        # The hash wasn't cached, so the next poll writes the payload
+        self.assertEqual(save_matches_of_an_event(9701, payload)['failed'], 0)
+        self.assertEqual(MatchesOfAnEvent.objects.get(Event_id=9701).Score1, 2)
+
+
+class TournamentEndRankingUpdateTest(TestCase):
+    """Rankings/players refresh in-process only once a recent event is mostly finished."""
+
+    CMD = 'oneFourSeven.management.commands.tournament_end_ranking_update'
+
+    def _run(self):
+        from django.core.management import call_command
+        with patch(f'{self.CMD}.run_update_rankings') as rankings, \
+             patch(f'{self.CMD}.run_update_players') as players:
+            call_command('tournament_end_ranking_update', stdout=StringIO())
+        return rankings, players
+
+    def _event(self, event_id, finished, running):
+        from .models import Event, MatchesOfAnEvent
+        ended = date.today() - timedelta(days=1)
+        event = Event.objects.create(ID=event_id, Name=f'Event {event_id}', StartDate=ended, EndDate=ended)
+        for number in range(finished + running):
+            MatchesOfAnEvent.objects.create(Event=event, Round=1, Number=number, Status=2 if number < finished else 1)
+
+    def test_mostly_finished_event_triggers_update(self):
+        self._event(9801, finished=9, running=1)
+        rankings, players = self._run()
+        rankings.assert_called_once_with(current_season_only=True, stdout=ANY)
+        players.assert_called_once_with(status='pro', sex=['men'], stdout=ANY)
+
+    def test_ratio_at_threshold_does_not_trigger(self):
+        self._event(9802, finished=8, running=2)
+        rankings, players = self._run()
+        rankings.assert_not_called()
+        players.assert_not_called()
+
+
+class UpdatePlayerDetailsMatchesTest(TestCase):
+    """t=8 match history is upserted on PlayerMatchHistory's logical key."""
+
+    def _run(self, matches):
+        from .management.commands.update_player_details import Command
+        command = Command()
+        command.stdout = StringIO()
+        response = MagicMock(status_code=200, json=lambda: matches)
+        with patch.object(Command, '_api_get', return_value=response):
+            return command._update_player_matches(_make_player(9901), seasons_count=1)
+
+    def test_rerun_updates_instead_of_duplicating(self):
+        match = {'ID': 501, 'EventID': 77, 'Round': 7, 'Player1ID': 9901, 'Player2ID': 42,
+                 'Score1': 3, 'Score2': 1, 'Status': 1}
+        self.assertTrue(self._run([match]))
+
+        # Session break: the API rotated the match ID and the score moved on
+        self.assertTrue(self._run([dict(match, ID=502, Score1=6, Status=3)]))
+
+        row = PlayerMatchHistory.objects.get(player_id=9901)
+        self.assertEqual((row.api_match_id, row.score1, row.status, row.round_name), (502, 6, 3, 'Final'))
+
+    def test_names_loaded_once_per_season(self):
+        from .models import Event
+        Event.objects.create(ID=78, Name='Names Open')
+        _make_player(43)
+        _make_player(9901)
+        matches = [
+            {'ID': 600 + n, 'EventID': 78, 'Round': n, 'Player1ID': 9901, 'Player2ID': 43 if n == 1 else 44}
+            for n in range(1, 6)
+        ]
+        # Player lookup (fixture), event names, player names, upsert
+        with self.assertNumQueries(4):
+            self._run(matches)
+        row = PlayerMatchHistory.objects.get(api_match_id=601)
+        self.assertEqual((row.event_name, row.player1_name, row.player2_name), ('Names Open', 'Test Player', 'Test Player'))
+        self.assertEqual(PlayerMatchHistory.objects.get(api_match_id=602).player2_name, 'Player 44')
+
+
+class UpdatePlayersSexArgTest(TestCase):
+    """--sex accepts several values so one run covers pro men and women."""
+
+    CMD = 'oneFourSeven.management.commands.update_players'
+
+    def _run(self, *args, **kwargs):
+        from django.core.management import call_command
+        with patch(f'{self.CMD}.fetch_players_data', return_value=[{'ID': 1}]) as fetch, \
+             patch(f'{self.CMD}.save_players') as save, \
+             patch(f'{self.CMD}.time.sleep'):
+            call_command('update_players', *args, season=2025, stdout=StringIO(), **kwargs)
+        return fetch, save
+
+    def test_multiple_sexes_single_run(self):
+        from oneFourSeven.constants import ST_PLAYER_PRO, SE_PLAYER_MEN, SE_PLAYER_WOMEN
+        fetch, save = self._run('--status', 'pro', '--sex', 'men', 'women')
+        self.assertEqual(
+            [c.args for c in fetch.call_args_list],
+            [(2025, ST_PLAYER_PRO, SE_PLAYER_MEN), (2025, ST_PLAYER_PRO, SE_PLAYER_WOMEN)],
+        )
+        save.assert_called_once()
+
+    def test_string_kwarg_still_accepted(self):
+        fetch, _ = self._run(status='pro', sex='women')
+        self.assertEqual(fetch.call_count, 1)
+
+
+class TestLiveSystemSimpleTest(TestCase):
+    """The plain-text live report strips emojis but keeps accented names."""
+
+    def test_accented_event_name_survives(self):
+        from django.core.management import call_command
+        from .models import Event
+        Event.objects.create(ID=9801, Name='Florian Nüßle Classic',
+                             StartDate=date.today(), EndDate=date.today())
+        out = StringIO()
+        call_command('test_live_system_simple', stdout=out)
+        output = out.getvalue()
+        self.assertIn('\nFlorian Nüßle Classic (ID: 9801)', output)
+        self.assertIn('Found 1 active tournaments:', output)
+        self.assertNotIn('🏟', output)
+        self.assertNotIn('\ufe0f', output)
+
+
+class SnookerAPIClientTest(TestCase):
+    """Rate-limit slots and HTTP failure classification in the shared API client."""
+
+    def _classify(self, status, headers=None):
+        from oneFourSeven.api_client import SnookerAPIClient
+        response = MagicMock(status_code=status, headers=headers or {}, url='http://api')
+        return SnookerAPIClient._classify_http_error(response)
+
+    def test_request_slots_are_spaced(self):
+        from oneFourSeven.api_client import SnookerAPIClient
+        from oneFourSeven.constants import MIN_REQUEST_INTERVAL
+        client = SnookerAPIClient()
+        with patch('oneFourSeven.api_client.time.time', return_value=1000.0):
+            waits = [client._reserve_request_slot() for _ in range(3)]
+        self.assertEqual(waits, [0, MIN_REQUEST_INTERVAL, 2 * MIN_REQUEST_INTERVAL])
+
+    def test_status_codes(self):
+        from oneFourSeven.exceptions import NoDataYet, RateLimited, ServerError
+        self.assertIsInstance(self._classify(404), NoDataYet)
+        self.assertIsInstance(self._classify(503), ServerError)
+        self.assertIsNone(self._classify(400))
+        limited = self._classify(429, {'Retry-After': '90'})
+        self.assertIsInstance(limited, RateLimited)
+        self.assertEqual(limited.retry_after, 90)
+
+    def test_player_profile_uses_shared_session(self):
+        from oneFourSeven.api_client import SnookerAPIClient
+        client = SnookerAPIClient()
+        client.session = MagicMock()
+        client.session.get.return_value = MagicMock(content=b'x', json=lambda: [{'ID': 7, 'LastName': 'Seven'}])
+        with patch('oneFourSeven.api_client.time.sleep'):
+            self.assertEqual(client.fetch_player_profile(7)['LastName'], 'Seven')
+            self.assertIsNone(client.fetch_player_profile(8))  # payload is for another player
+        self.assertEqual(client.session.get.call_count, 2)
+
+    def test_last_error_is_per_thread(self):
+        import threading
+        import requests
+        from oneFourSeven.api_client import SnookerAPIClient
+        from oneFourSeven.exceptions import RateLimited
+
+        def get(url, **kwargs):
+            if 'e=1' in url:
+                limited = MagicMock(status_code=429, headers={}, url=url, text='')
+                limited.raise_for_status.side_effect = requests.exceptions.HTTPError(response=limited)
+                return limited
+            return MagicMock(content=b'x', json=lambda: [])
+
+        client = SnookerAPIClient()
+        client.session = MagicMock(get=get)
+        failed, other_done, seen = threading.Event(), threading.Event(), []
+
+        def limited_worker():
+            client._make_request({'t': 6, 'e': 1})
+            failed.set()
+            other_done.wait(5)  # the other worker's call has reset its own error by now
+            seen.append(client.last_error)
+
+        def ok_worker():
+            failed.wait(5)
+            client._make_request({'t': 6, 'e': 2})
+            seen.append(client.last_error)
+            other_done.set()
+
+        with patch('oneFourSeven.api_client.time.sleep'):
+            threads = [threading.Thread(target=limited_worker), threading.Thread(target=ok_worker)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(10)
+
+        self.assertIsNone(seen[0])
+        self.assertIsInstance(seen[1], RateLimited)
+        self.assertIsNone(client.last_error)  # nothing failed on this thread
+
+
 # ---------------------------------------------------------------------------
 # Tests: player_match_history view — NULL scheduled_date sorts to bottom
 # ---------------------------------------------------------------------------